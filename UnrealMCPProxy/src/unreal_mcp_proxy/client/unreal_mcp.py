@@ -1,18 +1,91 @@
 """UnrealMCPClient - Client for communicating with Unreal Engine MCP Server."""
 
 import asyncio
-import json
+import itertools
 import logging
+import socket
+import time
 from enum import Enum
 from typing import Optional, Dict, Any
 import httpx
+import orjson
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from ..constants import DEFAULT_BACKEND_PORT, DEFAULT_BACKEND_TIMEOUT, DEFAULT_HEALTH_CHECK_INTERVAL
+from ..constants import (
+    DEFAULT_BACKEND_PORT, DEFAULT_BACKEND_TIMEOUT, DEFAULT_HEALTH_CHECK_INTERVAL,
+    DEFAULT_POOL_SIZE, DEFAULT_MAX_CONNECTIONS, DEFAULT_KEEPALIVE_EXPIRY, JSON_RPC_VERSION,
+    DEFAULT_MAX_INFLIGHT_REQUESTS,
+    DEFAULT_CACHING_TTL
+)
 
 logger = logging.getLogger(__name__)
 
+# Request bodies are pre-serialized with orjson, so the content type is set explicitly
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Health-check ping payload is identical on every tick, so it is serialized once.
+# A fixed id is fine here since health probes are never correlated with other requests.
+_PING_REQUEST = orjson.dumps({"jsonrpc": JSON_RPC_VERSION, "id": 0, "method": "ping"})
+
+# Pre-serialized JSON-RPC envelope prefixes for the methods the client sends, so a request
+# body is a bytes concatenation plus one orjson.dumps(params) instead of a dict round-trip
+_REQUEST_PREFIXES = {
+    method: b'{"jsonrpc":' + orjson.dumps(JSON_RPC_VERSION) + b',"method":' + orjson.dumps(method) + b',"id":'
+    for method in (
+        "initialize",
+        "ping",
+        "tools/list",
+        "tools/call",
+        "resources/list",
+        "resources/templates/list",
+        "resources/read",
+        "prompts/list",
+        "prompts/get",
+    )
+}
+
+
+def _encode_request(method: str, request_id: int, params: Optional[Dict[str, Any]]) -> bytes:
+    """Serialize a JSON-RPC request body.
+    
+    params is optional in JSON-RPC; the backend treats a missing object as empty,
+    so it is omitted when None.
+    """
+    prefix = _REQUEST_PREFIXES.get(method)
+    if prefix is None:
+        # Slow path for methods without a prebuilt prefix
+        request = {"jsonrpc": JSON_RPC_VERSION, "method": method, "id": request_id}
+        if params is not None:
+            request["params"] = params
+        return orjson.dumps(request)
+    if params is None:
+        return b"%s%d}" % (prefix, request_id)
+    return b'%s%d,"params":%s}' % (prefix, request_id, orjson.dumps(params))
+
+
+# Socket options for backend connections: no Nagle delay on small requests,
+# and OS keep-alive probes so dead pooled connections are noticed
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+# Seconds shutdown() waits for the health check loop to exit before cancelling it
+_SHUTDOWN_GRACE_PERIOD = 1.0
+
+# Side-effect-free methods whose concurrent identical calls can share one backend request.
+# The backend parses a single JSON-RPC object per POST (no array batches), so coalescing
+# identical in-flight requests is how concurrent callers save round-trips.
+_COALESCABLE_METHODS = frozenset({
+    "tools/list",
+    "resources/list",
+    "resources/templates/list",
+    "resources/read",
+    "prompts/list",
+    "prompts/get",
+})
+
 
 class ConnectionState(str, Enum):
     """Connection state to backend server."""
@@ -27,13 +100,20 @@ class UnrealMCPSettings(BaseSettings):
         env_prefix="unreal_mcp_proxy_backend_", 
         env_file=".env", 
         extra='ignore',
-        case_sensitive=False
+        case_sensitive=False,
+        frozen=True  # Validated once at construction; the client caches hot fields
     )
     
-    host: str = "localhost"
+    host: str = "localhost"  # Plain HTTP; the backend listens without TLS
     port: int = DEFAULT_BACKEND_PORT
     timeout: int = DEFAULT_BACKEND_TIMEOUT
     health_check_interval: int = DEFAULT_HEALTH_CHECK_INTERVAL
+    pool_size: int = DEFAULT_POOL_SIZE  # Max keep-alive connections to the backend
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY
+    max_inflight_requests: int = DEFAULT_MAX_INFLIGHT_REQUESTS  # Concurrent backend requests; extra calls queue
+    enable_health_check: bool = True  # Run the background health check loop after initialize_async()
+    caching_ttl: float = DEFAULT_CACHING_TTL  # Seconds a successful response keeps ONLINE fresh
     
     @field_validator('port')
     @classmethod
@@ -50,34 +130,164 @@ class UnrealMCPSettings(BaseSettings):
         if v <= 0:
             raise ValueError(f"Timeout must be positive, got {v}")
         return v
+    
+    @field_validator('pool_size', 'max_connections', 'max_inflight_requests')
+    @classmethod
+    def validate_pool_limits(cls, v: int) -> int:
+        """Validate connection pool limits are positive."""
+        if v <= 0:
+            raise ValueError(f"Connection pool limit must be positive, got {v}")
+        return v
+    
+    @field_validator('caching_ttl')
+    @classmethod
+    def validate_caching_ttl(cls, v: float) -> float:
+        """Validate caching TTL is non-negative."""
+        if v < 0:
+            raise ValueError(f"Caching TTL must be non-negative, got {v}")
+        return v
 
 
 class UnrealMCPClient:
     """Client for communicating with Unreal Engine MCP Server."""
     
-    def __init__(self, settings: Optional[UnrealMCPSettings] = None):
+    def __init__(self, settings: Optional[UnrealMCPSettings] = None, http_client: Optional[httpx.AsyncClient] = None):
         """Initialize the Unreal MCP client.
         
         Args:
             settings: Optional settings. If not provided, loads from environment.
+            http_client: Optional shared HTTP client. Lets several UnrealMCPClient instances
+                use one connection pool; the caller owns it and is responsible for closing it.
+                If not provided, the client creates and owns its own pooled HTTP client.
         """
         self.settings = settings or UnrealMCPSettings()
+        # Plain-attribute copies of settings read on every request/health tick
+        self._timeout = self.settings.timeout
+        self._health_check_interval = self.settings.health_check_interval
+        self._caching_ttl = self.settings.caching_ttl
         self.base_url = f"http://{self.settings.host}:{self.settings.port}/mcp"
-        self.state = ConnectionState.UNKNOWN
-        self.last_known_good_connection: Optional[float] = None
-        
-        # Create HTTP client with timeout
-        self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(self.settings.timeout),
-            base_url=self.base_url
-        )
-        
-        logger.info(f"UnrealMCPClient initialized: {self.base_url}")
+        # Set while the state is ONLINE, so callers can wait for the backend without polling
+        self._online_event = asyncio.Event()
+        self._state = ConnectionState.UNKNOWN
+        # Loop-clock (monotonic) time of the last successful response; see last_known_good_connection
+        self._last_good_loop_time: Optional[float] = None
+        self._wall_clock_offset: Optional[float] = None
+        # Loop-clock time until which the ONLINE state counts as fresh; set by real
+        # traffic, and health pings are skipped until then
+        self._fresh_until = 0.0
+        
+        # Monotonic JSON-RPC request IDs (unique per client lifetime)
+        self._next_id = itertools.count(1)
+        
+        # In-flight coalescable requests, keyed by (method, serialized params)
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        # In-flight ping() probe shared by concurrent callers
+        self._inflight_ping: Optional[asyncio.Task] = None
+        # Caps concurrent backend requests so a burst of tool calls queues here
+        # instead of piling onto the backend
+        self._request_slots = asyncio.Semaphore(self.settings.max_inflight_requests)
+        
+        # Requests pass the full URL and timeout explicitly, so a shared HTTP client
+        # configured for another backend or timeout still behaves correctly
+        self._http_timeout = httpx.Timeout(self._timeout)
+        self._owns_http_client = http_client is None
+        if http_client is None:
+            # Create HTTP client with timeout and explicit pool limits so concurrent
+            # calls reuse keep-alive connections instead of opening new sockets.
+            # JSON-RPC payloads are tiny, so disable Nagle on every pooled socket.
+            transport = httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.settings.pool_size,
+                    max_connections=self.settings.max_connections,
+                    keepalive_expiry=self.settings.keepalive_expiry
+                ),
+                socket_options=_SOCKET_OPTIONS
+            )
+            http_client = httpx.AsyncClient(
+                timeout=self._http_timeout,
+                base_url=self.base_url,
+                transport=transport
+            )
+        self.client = http_client
+        
+        logger.info("UnrealMCPClient initialized: %s", self.base_url)
         
         # Start background health check task (deferred until event loop is available)
         # The health check loop will determine connection state asynchronously
         self._health_check_task = None
         self._health_check_started = False
+        # Set once initialize_async() has run, whether or not it started the health check
+        self._initialized = False
+        # Set by shutdown() to stop the health check loop cooperatively
+        self._shutdown_event = asyncio.Event()
+    
+    @property
+    def state(self) -> ConnectionState:
+        """Current backend connection state."""
+        return self._state
+    
+    @state.setter
+    def state(self, value: ConnectionState):
+        self._state = value
+        if value == ConnectionState.ONLINE:
+            self._online_event.set()
+        else:
+            self._online_event.clear()
+    
+    async def wait_until_online(self, timeout: float) -> bool:
+        """Wait until the backend connection state is ONLINE.
+        
+        Returns immediately if it already is; otherwise wakes as soon as the health
+        check or a request marks the backend online.
+        
+        Args:
+            timeout: Maximum seconds to wait
+        
+        Returns:
+            True if the backend is online, False if the timeout elapsed first
+        """
+        try:
+            async with asyncio.timeout(timeout):
+                await self._online_event.wait()
+        except TimeoutError:
+            return False
+        return True
+    
+    @property
+    def last_known_good_connection(self) -> Optional[float]:
+        """Wall-clock timestamp of the last successful backend response, or None if never connected."""
+        if self._last_good_loop_time is None:
+            return None
+        return self._wall_clock_offset + self._last_good_loop_time
+    
+    def _mark_connection_good(self, from_traffic: bool = False):
+        """Record a successful backend response using the event loop's monotonic clock.
+        
+        Args:
+            from_traffic: True for real requests, which also refresh the caching window.
+                Health probes don't, so an idle proxy keeps pinging at the normal interval.
+        """
+        loop_time = asyncio.get_running_loop().time()
+        if self._wall_clock_offset is None:
+            # Captured once so wall-clock time can be derived on read instead of per call
+            self._wall_clock_offset = time.time() - loop_time
+        self._last_good_loop_time = loop_time
+        if from_traffic:
+            self._fresh_until = loop_time + self._caching_ttl
+    
+    def _is_online_fresh(self) -> bool:
+        """Check whether the ONLINE state was confirmed by traffic within caching_ttl."""
+        return self.state == ConnectionState.ONLINE and asyncio.get_running_loop().time() < self._fresh_until
+    
+    def _needs_health_ping(self) -> bool:
+        """Decide whether the health check loop should ping on this tick.
+        
+        Skips the ping only while the ONLINE state is fresh (confirmed by real traffic or
+        the initial connection check within caching_ttl). Otherwise pings every
+        health_check_interval, so an editor that closes or restarts while the proxy is
+        idle is still noticed and the OFFLINE -> ONLINE transition re-runs its waiters.
+        """
+        return not self._is_online_fresh()
     
     def _start_health_check(self):
         """Start the background health check task.
@@ -94,6 +304,7 @@ class UnrealMCPClient:
             return
         
         # We have a running loop, start the health check
+        self._shutdown_event.clear()
         if self._health_check_task is None:
             self._health_check_task = asyncio.create_task(self._health_check_loop())
             self._health_check_started = True
@@ -114,86 +325,112 @@ class UnrealMCPClient:
             True if backend is online, False otherwise
         """
         try:
-            # Use a shorter timeout for initial check (2 seconds)
-            import httpx
-            from ..constants import JSON_RPC_VERSION
-            
-            quick_timeout = httpx.Timeout(2.0)  # 2 second timeout for initial check
-            async with httpx.AsyncClient(timeout=quick_timeout, base_url=self.base_url) as quick_client:
-                request = {
-                    "jsonrpc": JSON_RPC_VERSION,
-                    "id": 1,
-                    "method": "tools/list",
-                    "params": {}
-                }
-                response = await quick_client.post("", json=request)
-                response.raise_for_status()
-                result = response.json()
-                # If we got a response (even with error), backend is online
-                return True
+            # Reuse the persistent client with a shorter per-request timeout (2 seconds)
+            # so the probe connection stays in the keep-alive pool for later calls
+            status_code = await self._post_ping(timeout=httpx.Timeout(2.0))
+            if status_code >= 400:
+                logger.debug("Initial connection check got HTTP %d", status_code)
+            # If we got a response (even with error), backend is online
+            return True
         except (httpx.ConnectError, httpx.TimeoutException):
             # Connection failed - backend is offline
             return False
         except Exception as e:
             # Other errors might indicate backend is online but had an issue
             # If we got any response, backend is online
-            logger.debug(f"Initial connection check had error but got response: {str(e)}")
+            logger.debug("Initial connection check had error but got response: %s", e)
             return True
     
-    async def initialize_async(self):
+    async def initialize_async(self, start_health_check: Optional[bool] = None):
         """Initialize async components (health check) when event loop is available.
         
         Performs an immediate connection check to set initial state, then starts
-        the background health check loop.
+        the background health check loop. The check goes through the pooled HTTP
+        client, so it also primes a keep-alive connection before the first call.
         
         Call this method after the event loop is running to start the health check.
+        
+        Args:
+            start_health_check: Whether to start the background health check loop.
+                Defaults to settings.enable_health_check. Short-lived clients (e.g. tests)
+                can pass False to skip creating the background task.
         """
+        if start_health_check is None:
+            start_health_check = self.settings.enable_health_check
+        
+
         # First, do an immediate connection check to set initial state
         if self.state == ConnectionState.UNKNOWN:
             logger.debug("Performing immediate connection check...")
             is_online = await self._check_connection_immediate()
             if is_online:
                 self.state = ConnectionState.ONLINE
-                import time
-                self.last_known_good_connection = time.time()
+                # Counts as traffic: opens the caching window so the health check
+                # keeps revalidating the state for a while even if no calls follow
+                self._mark_connection_good(from_traffic=True)
                 logger.info("Backend connection verified on initialization")
             else:
                 self.state = ConnectionState.OFFLINE
                 logger.debug("Backend appears offline on initialization")
         
         # Then start the background health check loop
-        if not self._health_check_started:
+        if start_health_check and not self._health_check_started:
             self._start_health_check()
+        
+        self._initialized = True
+    
+    async def _post_ping(self, timeout: Optional[httpx.Timeout] = None) -> int:
+        """Send the pre-serialized ping request and return the HTTP status code.
+        
+        The response body is not parsed: the backend answers every request it can
+        parse with HTTP 200, so the status code alone indicates liveness.
+        """
+        response = await self.client.post(
+            self.base_url, content=_PING_REQUEST, headers=_JSON_HEADERS, timeout=timeout or self._http_timeout
+        )
+        return response.status_code
     
     async def _health_check_loop(self):
-        """Background health check loop that periodically tests connection."""
-        while True:
+        """Background health check loop that periodically tests connection.
+        
+        Runs until shutdown() sets the shutdown event.
+        """
+        while not self._shutdown_event.is_set():
+            if not self._needs_health_ping():
+                await self._wait_for_next_health_check()
+                continue
             try:
-                # Test connection with ping
-                response = await self.call_method("ping", {})
-                if "result" in response:
+                # Test connection with a pre-serialized ping (status code only)
+                if await self._post_ping() == 200:
                     if self.state != ConnectionState.ONLINE:
                         logger.info("Backend connection established")
                     self.state = ConnectionState.ONLINE
+                    self._mark_connection_good()
                 else:
                     if self.state != ConnectionState.OFFLINE:
                         logger.warning("Backend connection lost")
                     self.state = ConnectionState.OFFLINE
             except Exception as e:
                 if self.state != ConnectionState.OFFLINE:
-                    logger.warning(f"Backend health check failed: {str(e)}")
+                    logger.warning("Backend health check failed: %s", e)
                 self.state = ConnectionState.OFFLINE
             
-            # Wait before next check (use interval from settings)
-            await asyncio.sleep(self.settings.health_check_interval)
+            await self._wait_for_next_health_check()
+    
+    async def _wait_for_next_health_check(self):
+        """Wait before next check (use interval from settings), waking early on shutdown."""
+        try:
+            async with asyncio.timeout(self._health_check_interval):
+                await self._shutdown_event.wait()
+        except TimeoutError:
+            pass
     
-    async def call_method(self, method: str, params: Optional[Dict[str, Any]] = None, request_id: Optional[int] = None) -> Dict[str, Any]:
+    async def call_method(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Call an MCP method on the backend server.
         
         Args:
             method: The MCP method name (e.g., "tools/list", "tools/call")
             params: Optional parameters for the method
-            request_id: Optional request ID (auto-generated if not provided)
         
         Returns:
             Response dictionary with "result" or "error" key
@@ -203,63 +440,75 @@ class UnrealMCPClient:
             httpx.TimeoutException: If the request times out
             ConnectionError: If the server is not available
         """
+        if method not in _COALESCABLE_METHODS:
+            return await self._send_request(method, params)
+        
+        # Join an identical request that is already in flight instead of sending another.
+        # shield() keeps one caller's cancellation from cancelling the shared request.
+        key = (method, orjson.dumps(params, option=orjson.OPT_SORT_KEYS) if params else b"")
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send_request(method, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+    
+    async def _send_request(self, method: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Send a single JSON-RPC request to the backend and return the parsed response."""
         # Note: We don't check state here - let the async HTTP call handle connection errors.
         # The health check loop keeps the state updated, and the HTTP client will raise
         # appropriate exceptions if the connection fails.
         
-        if request_id is None:
-            import random
-            request_id = random.randint(1, 2**31 - 1)
+        request_id = next(self._next_id)
         
-        from ..constants import JSON_RPC_VERSION
-        
-        request = {
-            "jsonrpc": JSON_RPC_VERSION,
-            "id": request_id,
-            "method": method,
-            "params": params or {}
-        }
-        
-        logger.debug(f"Calling backend method '{method}' with request_id={request_id}")
+        # Checked once per request and reused for every debug line below
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug("Calling backend method '%s' with request_id=%d", method, request_id)
         
         try:
-            response = await self.client.post("", json=request)
-            response.raise_for_status()
+            async with self._request_slots:
+                response = await self.client.post(
+                    self.base_url, content=_encode_request(method, request_id, params), headers=_JSON_HEADERS,
+                    timeout=self._http_timeout
+                )
+            # The backend answers 200 even for JSON-RPC errors; only build the
+            # HTTPStatusError off the steady-state path
+            if response.status_code >= 400:
+                response.raise_for_status()
             
-            result = response.json()
+            result = orjson.loads(response.content)
             
             # Check for JSON-RPC errors
             if "error" in result:
                 error = result["error"]
                 logger.error(
-                    f"Backend returned error for method '{method}': "
-                    f"code={error.get('code')}, message={error.get('message')}"
+                    "Backend returned error for method '%s': code=%s, message=%s",
+                    method, error.get('code'), error.get('message')
                 )
-            else:
-                logger.debug(f"Backend method '{method}' succeeded")
+            elif debug_enabled:
+                logger.debug("Backend method '%s' succeeded", method)
             
             # Update connection state on successful response
             self.state = ConnectionState.ONLINE
-            import time
-            self.last_known_good_connection = time.time()
+            self._mark_connection_good(from_traffic=True)
             
             return result
             
-        except httpx.ConnectError as e:
-            logger.error(f"Connection error calling backend method '{method}': {str(e)}", exc_info=True)
-            self.state = ConnectionState.OFFLINE
-            raise ConnectionError(f"Failed to connect to Unreal MCP server: {str(e)}")
-        except httpx.TimeoutException as e:
-            logger.warning(f"Timeout calling backend method '{method}' (timeout={self.settings.timeout}s)")
-            self.state = ConnectionState.OFFLINE
-            raise TimeoutError(f"Request to Unreal MCP server timed out: {str(e)}")
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error calling backend method '{method}': {str(e)}", exc_info=True)
-            self.state = ConnectionState.OFFLINE
-            raise
         except Exception as e:
-            logger.error(f"Unexpected error calling backend method '{method}': {str(e)}", exc_info=True)
+            # Any failure marks the backend offline; dispatch on type for logging and re-raising
             self.state = ConnectionState.OFFLINE
+            if isinstance(e, httpx.ConnectError):
+                # Routine while the editor is not running - no traceback needed
+                logger.warning("Connection error calling backend method '%s': %s", method, e)
+                raise ConnectionError(f"Failed to connect to Unreal MCP server: {str(e)}") from e
+            if isinstance(e, httpx.TimeoutException):
+                logger.warning("Timeout calling backend method '%s' (timeout=%ss)", method, self._timeout)
+                raise TimeoutError(f"Request to Unreal MCP server timed out: {str(e)}") from e
+            if isinstance(e, httpx.HTTPError):
+                logger.error("HTTP error calling backend method '%s': %s", method, e)
+            else:
+                logger.error("Unexpected error calling backend method '%s': %s", method, e, exc_info=True)
             raise
     
     async def ping(self) -> bool:
@@ -268,12 +517,33 @@ class UnrealMCPClient:
         Returns:
             True if server responds, False otherwise.
         """
+        # Recent successful traffic already proves the backend is up
+        if self._is_online_fresh():
+            return True
+        
+        # Concurrent pings share one probe; shield() keeps a cancelled caller from cancelling it
+        task = self._inflight_ping
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._ping_once())
+            self._inflight_ping = task
+        return await asyncio.shield(task)
+    
+    async def _ping_once(self) -> bool:
+        """Send a single ping probe and update the connection state."""
         try:
-            result = await self.call_method("ping")
-            return "error" not in result
+            status_code = await self._post_ping()
         except Exception as e:
-            logger.debug(f"Ping failed: {str(e)}")
+            logger.debug("Ping failed: %s", e)
+            self.state = ConnectionState.OFFLINE
             return False
+        if status_code != 200:
+            # Same outcome as a non-200 health check
+            logger.debug("Ping got HTTP %d", status_code)
+            self.state = ConnectionState.OFFLINE
+            return False
+        self.state = ConnectionState.ONLINE
+        self._mark_connection_good()
+        return True
     
     async def get_tools_list(self) -> Dict[str, Any]:
         """Get the list of tools from the backend server.
@@ -281,7 +551,7 @@ class UnrealMCPClient:
         Returns:
             Response dictionary with tools list.
         """
-        return await self.call_method("tools/list", params={})
+        return await self.call_method("tools/list")
     
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Call a tool on the backend server.
@@ -307,10 +577,7 @@ class UnrealMCPClient:
         Returns:
             Response dictionary with resources list.
         """
-        params = {}
-        if cursor:
-            params["cursor"] = cursor
-        return await self.call_method("resources/list", params=params)
+        return await self.call_method("resources/list", params={"cursor": cursor} if cursor else None)
     
     async def get_resource_templates_list(self, cursor: Optional[str] = None) -> Dict[str, Any]:
         """Get the list of resource templates from the backend server.
@@ -321,10 +588,7 @@ class UnrealMCPClient:
         Returns:
             Response dictionary with resource templates list.
         """
-        params = {}
-        if cursor:
-            params["cursor"] = cursor
-        return await self.call_method("resources/templates/list", params=params)
+        return await self.call_method("resources/templates/list", params={"cursor": cursor} if cursor else None)
     
     async def read_resource(self, uri: str) -> Dict[str, Any]:
         """Read a resource from the backend server.
@@ -346,10 +610,7 @@ class UnrealMCPClient:
         Returns:
             Response dictionary with prompts list.
         """
-        params = {}
-        if cursor:
-            params["cursor"] = cursor
-        return await self.call_method("prompts/list", params=params)
+        return await self.call_method("prompts/list", params={"cursor": cursor} if cursor else None)
     
     async def get_prompt(self, name: str, arguments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get a prompt from the backend server.
@@ -367,20 +628,24 @@ class UnrealMCPClient:
         return await self.call_method("prompts/get", params=params)
     
     async def shutdown(self):
-        """Shutdown the client and cancel background tasks."""
-        # Cancel health check task if running
+        """Shutdown the client and stop background tasks."""
+        # Signal the health check loop to exit; it stops at its next wait
+        self._shutdown_event.set()
         if self._health_check_task is not None and not self._health_check_task.done():
-            self._health_check_task.cancel()
+            # Bounded wait: normally the loop exits on the event; an in-flight ping that
+            # outlasts the grace period is cancelled by the timeout and shutdown proceeds
             try:
-                await self._health_check_task
-            except asyncio.CancelledError:
-                pass
-            self._health_check_task = None
-            self._health_check_started = False
-            logger.debug("Health check task cancelled")
-        
-        # Close HTTP client
-        await self.client.aclose()
+                async with asyncio.timeout(_SHUTDOWN_GRACE_PERIOD):
+                    await self._health_check_task
+                logger.debug("Health check task stopped")
+            except TimeoutError:
+                logger.warning("Health check task did not stop within %ss, cancelled", _SHUTDOWN_GRACE_PERIOD)
+        self._health_check_task = None
+        self._health_check_started = False
+        
+        # Close HTTP client (a shared client passed in by the caller is left open)
+        if self._owns_http_client:
+            await self.client.aclose()
         logger.info("UnrealMCPClient closed")
     
     async def close(self):
@@ -1,14 +1,82 @@
 """Tool compatibility checking for UnrealMCPProxy."""
 
-import json
+import asyncio
 import logging
+import threading
 from typing import Dict, Any, Optional
 
+import orjson
+
 from .client.unreal_mcp import UnrealMCPClient, ConnectionState
 from .tool_definitions import compare_tool_definitions
 
 logger = logging.getLogger(__name__)
 
+# Last completed check: (proxy definitions object, sorted-key backend tool list bytes,
+# number of incompatible tools, first issue message). Reconnects that see the same
+# catalog re-report this outcome instead of comparing again. The definitions object
+# itself is held (not its id) so a later object can't be mistaken for it.
+_last_check: Optional[tuple[Dict[str, Dict[str, Any]], bytes, int, Optional[str]]] = None
+
+
+# Comparison results keyed by (proxy bytes, backend bytes), both serialized with
+# sorted keys; cleared when full so stale catalogs don't accumulate. _compare_all
+# runs in worker threads, so every lookup and insert holds _comparison_cache_lock.
+_COMPARISON_CACHE_MAX_ENTRIES = 1024
+_comparison_cache: Dict[tuple[bytes, bytes], tuple[str, ...]] = {}
+_comparison_cache_lock = threading.Lock()
+
+
+def _dump_schema(schema: Dict[str, Any]) -> str:
+    """Pretty-print a JSON schema with sorted keys for log output."""
+    return orjson.dumps(schema, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+
+
+def _log_compatibility_summary(tool_count: int, issues_found: int, first_issue: Optional[str]):
+    """Log the outcome of a compatibility check.
+    
+    Args:
+        tool_count: Number of tools reported by the backend
+        issues_found: Number of tools with compatibility issues
+        first_issue: Warning message for the first incompatible tool, if any
+    """
+    if issues_found == 0:
+        logger.info(f"Tool discovery completed: {tool_count} tools found, all compatible")
+    else:
+        if first_issue:
+            logger.warning(first_issue)
+        logger.warning(f"Tool discovery completed: {tool_count} tools found, {issues_found} compatibility issue(s) detected")
+
+
+def _compare_all(pairs: list[tuple[Dict[str, Any], Dict[str, Any]]]) -> list[tuple[str, ...]]:
+    """Run compare_tool_definitions over (proxy, backend) pairs.
+    
+    Results are memoized on the canonical serialization of both definitions, so
+    tools that did not change since an earlier check (e.g. when only part of the
+    backend catalog changed) are not compared again. Safe to call from worker
+    threads (it runs under asyncio.to_thread).
+    
+    Args:
+        pairs: List of (proxy tool definition, backend tool) tuples
+    
+    Returns:
+        List of issue tuples, in the same order as pairs
+    """
+    all_issues = []
+    for proxy, backend in pairs:
+        key = (orjson.dumps(proxy, option=orjson.OPT_SORT_KEYS), orjson.dumps(backend, option=orjson.OPT_SORT_KEYS))
+        with _comparison_cache_lock:
+            issues = _comparison_cache.get(key)
+        if issues is None:
+            # Compare outside the lock; a concurrent check may compute the same entry
+            issues = tuple(compare_tool_definitions(proxy, backend))
+            with _comparison_cache_lock:
+                if len(_comparison_cache) >= _COMPARISON_CACHE_MAX_ENTRIES:
+                    _comparison_cache.clear()
+                _comparison_cache[key] = issues
+        all_issues.append(issues)
+    return all_issues
+
 
 async def check_tool_compatibility(
     client: UnrealMCPClient,
@@ -23,6 +91,7 @@ async def check_tool_compatibility(
         client: The UnrealMCPClient instance
         cached_proxy_tool_definitions: Dictionary of proxy tool definitions
     """
+    global _last_check
     logger.info("Checking tool definition compatibility")
     
     # Try to get tools from backend and compare
@@ -37,42 +106,71 @@ async def check_tool_compatibility(
             
             backend_tools = response.get("result", {}).get("tools", [])
             
-            # Check compatibility of each backend tool with proxy tool definition
-            compatibility_issues_found = 0
+            # The backend catalog only changes across editor restarts; skip the
+            # comparison when it matches the one already checked
+            backend_json = orjson.dumps(backend_tools, option=orjson.OPT_SORT_KEYS)
+            last_check = _last_check
+            if (
+                last_check is not None
+                and last_check[0] is cached_proxy_tool_definitions
+                and last_check[1] == backend_json
+            ):
+                logger.info("Backend tool definitions unchanged since last check, reusing its result")
+                _log_compatibility_summary(len(backend_tools), last_check[2], last_check[3])
+                return
+            
+            # Pair up backend tools with proxy tool definitions
+            proxy_tool_names = frozenset(cached_proxy_tool_definitions) if cached_proxy_tool_definitions else frozenset()
+            named_pairs = []
             for backend_tool in backend_tools:
                 tool_name = backend_tool.get("name")
                 if not tool_name:
                     continue
                 
-                proxy_tool_definition = cached_proxy_tool_definitions.get(tool_name) if cached_proxy_tool_definitions else None
-                if proxy_tool_definition:
-                    issues = compare_tool_definitions(proxy_tool_definition, backend_tool)
-                    if issues:
-                        compatibility_issues_found += 1
-                        # Log detailed issues for debugging
-                        # Always log the first compatibility issue in detail to help debugging
-                        if compatibility_issues_found == 1:
-                            logger.warning(f"=== SCHEMA COMPATIBILITY ISSUE FOR '{tool_name}' ===")
-                            logger.warning(f"Proxy inputSchema:\n{json.dumps(proxy_tool_definition.get('inputSchema', {}), indent=2, sort_keys=True)}")
-                            logger.warning(f"Backend inputSchema:\n{json.dumps(backend_tool.get('inputSchema', {}), indent=2, sort_keys=True)}")
-                            logger.warning("=" * 60)
-                        logger.warning(
-                            f"Schema compatibility issue detected for '{tool_name}': "
-                            f"{', '.join(issues)}. "
-                            f"Please update UnrealMCPProxy/src/unreal_mcp_proxy/tool_definitions.py "
-                            f"to fix compatibility issues. Note: Proxy schemas can differ from backend "
-                            f"as long as required fields are present and types are compatible."
-                        )
-                else:
+                if tool_name not in proxy_tool_names:
                     logger.warning(
                         f"Tool '{tool_name}' found in backend but not in proxy tool definitions. "
                         f"Please add it to tool_definitions.py"
                     )
+                    continue
+                
+                named_pairs.append((tool_name, cached_proxy_tool_definitions[tool_name], backend_tool))
+            
+            # Schema diffing is pure Python; run it off the event loop so early
+            # requests aren't stalled while the catalog is compared
+            all_issues = await asyncio.to_thread(
+                _compare_all, [(proxy, backend) for _, proxy, backend in named_pairs]
+            )
+            
+            # Check compatibility of each backend tool with proxy tool definition
+            compatibility_issues_found = 0
+            first_issue = None
+            for (tool_name, proxy_tool_definition, backend_tool), issues in zip(named_pairs, all_issues):
+                if issues:
+                    compatibility_issues_found += 1
+                    # Log detailed issues for debugging
+                    # Always log the first compatibility issue in detail to help debugging
+                    # (schema dumps are skipped entirely if WARNING is filtered out)
+                    if compatibility_issues_found == 1 and logger.isEnabledFor(logging.WARNING):
+                        logger.warning(f"=== SCHEMA COMPATIBILITY ISSUE FOR '{tool_name}' ===")
+                        logger.warning(f"Proxy inputSchema:\n{_dump_schema(proxy_tool_definition.get('inputSchema', {}))}")
+                        logger.warning(f"Backend inputSchema:\n{_dump_schema(backend_tool.get('inputSchema', {}))}")
+                        logger.warning("=" * 60)
+                    issue_message = (
+                        f"Schema compatibility issue detected for '{tool_name}': "
+                        f"{', '.join(issues)}. "
+                        f"Please update UnrealMCPProxy/src/unreal_mcp_proxy/tool_definitions.py "
+                        f"to fix compatibility issues. Note: Proxy schemas can differ from backend "
+                        f"as long as required fields are present and types are compatible."
+                    )
+                    if first_issue is None:
+                        first_issue = issue_message
+                    logger.warning(issue_message)
+            
+            # The first issue was already logged in full above; only the summary here
+            _log_compatibility_summary(len(backend_tools), compatibility_issues_found, None)
             
-            if compatibility_issues_found == 0:
-                logger.info(f"Tool discovery completed: {len(backend_tools)} tools found, all compatible")
-            else:
-                logger.warning(f"Tool discovery completed: {len(backend_tools)} tools found, {compatibility_issues_found} compatibility issue(s) detected")
+            _last_check = (cached_proxy_tool_definitions, backend_json, compatibility_issues_found, first_issue)
             
         except Exception as e:
             logger.error(f"Error during tool discovery: {str(e)}", exc_info=True)
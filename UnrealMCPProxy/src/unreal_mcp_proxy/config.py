@@ -1,5 +1,7 @@
 """Configuration and settings for UnrealMCPProxy."""
 
+import asyncio
+import functools
 import logging
 from enum import Enum
 from pathlib import Path
@@ -11,7 +13,7 @@ from .constants import (
     DEFAULT_BACKEND_PORT, DEFAULT_PROXY_PORT, DEFAULT_BACKEND_TIMEOUT,
     DEFAULT_HEALTH_CHECK_INTERVAL, DEFAULT_RETRY_MAX_ATTEMPTS,
     DEFAULT_RETRY_INITIAL_DELAY, DEFAULT_RETRY_MAX_DELAY,
-    DEFAULT_RETRY_BACKOFF_FACTOR
+    DEFAULT_RETRY_BACKOFF_FACTOR, DEFAULT_CACHING_TTL
 )
 
 
@@ -32,6 +34,7 @@ class ServerSettings(BaseSettings):
     backend_timeout: int = DEFAULT_BACKEND_TIMEOUT
     health_check_interval: int = DEFAULT_HEALTH_CHECK_INTERVAL
     health_check_start_on_first_call: bool = True  # Start health check on first tool call (lazy initialization)
+    caching_ttl: float = DEFAULT_CACHING_TTL  # Seconds a successful backend response keeps ONLINE state fresh
     
     # Retry settings for read-only operations
     retry_max_attempts: int = DEFAULT_RETRY_MAX_ATTEMPTS
@@ -76,6 +79,14 @@ class ServerSettings(BaseSettings):
             raise ValueError(f"Timeout must be positive, got {v}")
         return v
     
+    @field_validator('caching_ttl')
+    @classmethod
+    def validate_caching_ttl(cls, v: float) -> float:
+        """Validate caching TTL is non-negative."""
+        if v < 0:
+            raise ValueError(f"Caching TTL must be non-negative, got {v}")
+        return v
+    
     @field_validator('retry_max_attempts')
     @classmethod
     def validate_retry_attempts(cls, v: int) -> int:
@@ -92,10 +103,10 @@ class ServerSettings(BaseSettings):
             raise ValueError(f"Retry delay must be positive, got {v}")
         return v
     
-    @field_validator('transport')
+    @field_validator('transport', mode='before')
     @classmethod
     def validate_transport(cls, v: str | MCPTransport) -> MCPTransport:
-        """Validate transport type."""
+        """Validate transport type (case-insensitive, before enum coercion)."""
         if isinstance(v, str):
             try:
                 return MCPTransport(v.lower())
@@ -113,6 +124,19 @@ class ServerSettings(BaseSettings):
         return v.upper()
 
 
+@functools.cache
+def get_server_settings() -> ServerSettings:
+    """Get the process-wide ServerSettings instance.
+    
+    Environment variables and the .env file are read on the first call only;
+    later calls return the same instance.
+    
+    Returns:
+        Shared ServerSettings instance
+    """
+    return ServerSettings()
+
+
 def setup_logging(settings: ServerSettings):
     """Configure logging based on settings."""
     # In debug mode, force DEBUG log level
@@ -156,3 +180,34 @@ def setup_logging(settings: ServerSettings):
     proxy_logger = logging.getLogger("unreal_mcp_proxy")
     proxy_logger.setLevel(numeric_level)
 
+
+
+def setup_event_loop():
+    """Configure the event loop the server (or test runner) is about to create.
+    
+    Uses uvloop as the asyncio event loop implementation if it is installed. uvloop is
+    an optional dependency (not available on Windows); when it is missing, the default
+    asyncio event loop is used. New loops also get the eager task factory (Python 3.12+),
+    so coroutines that finish before their first suspension skip a scheduler round-trip.
+    Must be called before the loop is created.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        base_policy = asyncio.DefaultEventLoopPolicy
+    else:
+        base_policy = uvloop.EventLoopPolicy
+    
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is None:
+        if base_policy is not asyncio.DefaultEventLoopPolicy:
+            asyncio.set_event_loop_policy(base_policy())
+        return
+    
+    class EagerTaskEventLoopPolicy(base_policy):
+        def new_event_loop(self):
+            loop = super().new_event_loop()
+            loop.set_task_factory(eager_task_factory)
+            return loop
+    
+    asyncio.set_event_loop_policy(EagerTaskEventLoopPolicy())
@@ -7,16 +7,32 @@ DEFAULT_PROXY_PORT = 30070
 # Default timeouts (in seconds)
 DEFAULT_BACKEND_TIMEOUT = 30
 DEFAULT_COMPILATION_TIMEOUT = 300.0  # 5 minutes
+COMPATIBILITY_CHECK_WAIT_TIMEOUT = 5.0  # Max wait for the backend to come online before checking
 
 # Default health check interval (in seconds)
 DEFAULT_HEALTH_CHECK_INTERVAL = 5
 
+# Connection state caching (in seconds): a successful backend response keeps the ONLINE
+# state fresh for CACHING_TTL, skipping health pings; after that, health checks resume
+DEFAULT_CACHING_TTL = 5.0
+
+# Default HTTP connection pool limits for the backend client
+DEFAULT_POOL_SIZE = 32  # Max keep-alive connections
+DEFAULT_MAX_CONNECTIONS = 128
+DEFAULT_KEEPALIVE_EXPIRY = 30.0  # seconds
+
+# Max concurrent requests sent to the backend; it serves MCP calls on the game thread
+DEFAULT_MAX_INFLIGHT_REQUESTS = 16
+
 # Default retry settings
 DEFAULT_RETRY_MAX_ATTEMPTS = 3
 DEFAULT_RETRY_INITIAL_DELAY = 0.5
 DEFAULT_RETRY_MAX_DELAY = 5.0
 DEFAULT_RETRY_BACKOFF_FACTOR = 2.0
 
+# Message returned for tool calls and resource reads while the backend is offline
+BACKEND_UNAVAILABLE_MESSAGE = "Unreal MCP server is not available. Please ensure Unreal Editor is running and the UnrealMCPServer plugin is enabled."
+
 # Default export format
 DEFAULT_EXPORT_FORMAT = "T3D"
 
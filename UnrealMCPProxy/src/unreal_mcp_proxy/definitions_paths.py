@@ -0,0 +1,146 @@
+"""Shared path, settings and file helpers for prompt and resource definitions.
+
+Path Configuration:
+- Default: Relative path ../Resources from UnrealMCPProxy/ directory
+- Custom: Set UNREAL_MCP_PROXY_DEFINITIONS_PATH environment variable
+  - Absolute path: /path/to/Resources
+  - Relative path from plugin root: ../CustomResources
+"""
+
+import functools
+import mmap
+import os
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+import orjson
+
+# This file is in: UnrealMCPProxy/src/unreal_mcp_proxy/definitions_paths.py
+# Plugin root is: UnrealMCPProxy/ (parent of src/)
+_PLUGIN_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Definition files at least this large are memory-mapped instead of read into a bytes copy
+_MMAP_THRESHOLD = 64 * 1024
+
+# Seconds a loaded definitions file is served without re-checking its modification
+# time; edits are picked up within this window
+DEFINITIONS_REVALIDATE_INTERVAL = 1.0
+
+# String values up to this length are interned; repeated short values (MIME types,
+# roles, argument names) then share one object. Long texts are left as-is.
+_INTERN_MAX_LENGTH = 64
+
+
+def get_settings():
+    """Lazily load settings to avoid circular import issues.
+    
+    Not memoized here: get_server_settings() already caches a successful load, and a
+    failed load is retried on the next call instead of being pinned for the process.
+    """
+    try:
+        from .config import get_server_settings
+        return get_server_settings()
+    except (ImportError, ValueError):
+        return None
+
+
+# Resources directory, memoized once it was resolved with settings available
+_resources_path: Optional[Path] = None
+
+
+def get_resources_path() -> Path:
+    """Get the path to the Resources directory containing JSON definitions.
+    
+    Uses environment variable if set, otherwise defaults to relative path
+    from plugin root: ../Resources. Resolved once per process when settings load;
+    a fallback resolved without settings is not memoized.
+    
+    Returns:
+        Path to Resources directory
+    """
+    global _resources_path
+    if _resources_path is not None:
+        return _resources_path
+    
+    # Get definitions path from settings or environment
+    settings = get_settings()
+    if settings and settings.definitions_path:
+        definitions_path_str = settings.definitions_path
+    else:
+        definitions_path_str = os.getenv("UNREAL_MCP_PROXY_DEFINITIONS_PATH")
+    
+    if definitions_path_str:
+        # User-specified path (absolute or relative to plugin root)
+        definitions_path = Path(definitions_path_str)
+        if not definitions_path.is_absolute():
+            # Relative path - resolve from plugin root
+            definitions_path = _PLUGIN_ROOT.parent / definitions_path
+    else:
+        # Default: relative path ../Resources from plugin root
+        definitions_path = _PLUGIN_ROOT.parent / "Resources"
+    
+    if settings is not None:
+        _resources_path = definitions_path
+    return definitions_path
+
+
+@functools.lru_cache(maxsize=8)
+def _definitions_file_path(resources_path: Path, filename: str) -> str:
+    """Join a definitions file name onto the Resources directory, once per pair."""
+    return str(resources_path / filename)
+
+
+def get_prompts_json_path() -> str:
+    """Get the path to prompts.json file.
+    
+    Returned as a string so loaders can pass it to os.stat() and open() as-is.
+    """
+    return _definitions_file_path(get_resources_path(), "prompts.json")
+
+
+def get_resources_json_path() -> str:
+    """Get the path to resources.json file.
+    
+    Returned as a string so loaders can pass it to os.stat() and open() as-is.
+    """
+    return _definitions_file_path(get_resources_path(), "resources.json")
+
+
+def _intern_strings(value: Any) -> Any:
+    """Recursively intern short string values in parsed JSON data, in place."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            value[key] = _intern_strings(item)
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            value[index] = _intern_strings(item)
+    elif isinstance(value, str) and len(value) <= _INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+def load_definitions_json(path: str) -> Any:
+    """Read and parse a JSON definitions file.
+    
+    Large files are memory-mapped and parsed straight from the mapping, so the file
+    contents are not copied into an intermediate bytes object. Short string values
+    are interned, since the parsed data is cached for the process lifetime.
+    
+    Args:
+        path: Path to the JSON file
+    
+    Returns:
+        Parsed JSON data
+    
+    Raises:
+        FileNotFoundError: If the file does not exist
+        orjson.JSONDecodeError: If the file is not valid JSON
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            data = orjson.loads(f.read())
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                data = orjson.loads(view)
+    return _intern_strings(data)
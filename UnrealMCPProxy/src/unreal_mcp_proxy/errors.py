@@ -1,8 +1,9 @@
 """Error handling utilities for UnrealMCPProxy."""
 
-import json
 from typing import Dict, Any, Optional
 
+import orjson
+
 
 def create_error_response(error_message: str, error_code: Optional[str] = None) -> Dict[str, Any]:
     """Create a standardized error response in MCP format.
@@ -14,15 +15,16 @@ def create_error_response(error_message: str, error_code: Optional[str] = None)
     Returns:
         Error response dictionary in MCP format
     """
-    error_data = {"error": error_message}
     if error_code:
-        error_data["code"] = error_code
+        text = orjson.dumps({"error": error_message, "code": error_code}).decode()
+    else:
+        text = orjson.dumps({"error": error_message}).decode()
     
     return {
         "isError": True,
         "content": [{
             "type": "text",
-            "text": json.dumps(error_data)
+            "text": text
         }]
     }
 
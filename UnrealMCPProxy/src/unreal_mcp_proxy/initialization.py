@@ -5,6 +5,7 @@ import logging
 from typing import Optional, Dict, Any
 
 from .config import ServerSettings
+from .constants import COMPATIBILITY_CHECK_WAIT_TIMEOUT
 from .client.unreal_mcp import UnrealMCPClient, UnrealMCPSettings, ConnectionState
 from .compatibility import check_tool_compatibility
 from .tool_definitions import get_tool_definitions
@@ -31,8 +32,8 @@ async def initialize_proxy(
     """
     logger.info("Initializing proxy components...")
     
-    # Start health check if not already started
-    if not client._health_check_started:
+    # Initialize the client (and start the health check) if not already done
+    if not client._initialized:
         try:
             await client.initialize_async()
             logger.debug("Health check started")
@@ -49,9 +50,8 @@ async def initialize_proxy(
     # Check compatibility when backend comes online (async, non-blocking)
     async def check_compatibility_when_online():
         """Check compatibility when backend comes online."""
-        # Wait a bit for health check to establish connection
-        await asyncio.sleep(1)
-        if client.state == ConnectionState.ONLINE:
+        # Wake as soon as the health check establishes the connection
+        if await client.wait_until_online(COMPATIBILITY_CHECK_WAIT_TIMEOUT):
             await check_tool_compatibility(client, cached_proxy_tool_definitions)
     
     # Start compatibility check task (non-blocking)
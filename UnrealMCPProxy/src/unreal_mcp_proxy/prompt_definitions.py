@@ -13,84 +13,107 @@ Path Configuration:
   - Relative path from plugin root: ../CustomResources
 """
 
-import json
+import functools
 import os
-from pathlib import Path
-from typing import Dict, Any, List, Optional
+import string
+import time
+import types
+from typing import Dict, Any, List, Mapping, Optional
 
-# Lazy loading of settings to avoid circular imports
-_settings_cache = None
+import orjson
 
-def _get_settings():
-    """Lazily load settings to avoid circular import issues."""
-    global _settings_cache
-    if _settings_cache is None:
-        try:
-            from .config import ServerSettings
-            _settings_cache = ServerSettings()
-        except (ImportError, Exception):
-            _settings_cache = None
-    return _settings_cache
+from .definitions_paths import (
+    DEFINITIONS_REVALIDATE_INTERVAL, get_resources_path, get_prompts_json_path, load_definitions_json
+)
 
 
-def _get_resources_path() -> Path:
-    """Get the path to the Resources directory containing JSON definitions.
+# Shared read-only arguments for prompts generated without any
+_EMPTY_ARGUMENTS: Mapping[str, Any] = types.MappingProxyType({})
+
+
+class _MissingArgumentsDict(dict):
+    """Argument mapping that leaves placeholders for missing arguments as-is."""
     
-    Uses environment variable if set, otherwise defaults to relative path
-    from plugin root: ../Resources
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_template(template: str) -> Optional[tuple[tuple[str, Optional[str]], ...]]:
+    """Split a prompt template into (literal text, field name) segments once.
+    
+    Args:
+        template: Prompt template using str.format placeholders
     
     Returns:
-        Path to Resources directory
+        Tuple of segments, or None if the template uses format specs, conversions,
+        or indexed fields (those are left to str.format_map)
     """
-    # This file is in: UnrealMCPProxy/src/unreal_mcp_proxy/prompt_definitions.py
-    # Plugin root is: UnrealMCPProxy/ (parent of src/)
-    _current_file = Path(__file__).resolve()
-    _plugin_root = _current_file.parent.parent.parent  # Go up to UnrealMCPProxy/
-    
-    # Get definitions path from settings or environment
-    settings = _get_settings()
-    if settings and settings.definitions_path:
-        definitions_path_str = settings.definitions_path
-    else:
-        definitions_path_str = os.getenv("UNREAL_MCP_PROXY_DEFINITIONS_PATH")
-    
-    if definitions_path_str:
-        # User-specified path (absolute or relative to plugin root)
-        definitions_path = Path(definitions_path_str)
-        if not definitions_path.is_absolute():
-            # Relative path - resolve from plugin root
-            definitions_path = _plugin_root.parent / definitions_path
-        return definitions_path
-    else:
-        # Default: relative path ../Resources from plugin root
-        return _plugin_root.parent / "Resources"
-
-
-def _get_prompts_json_path() -> Path:
-    """Get the path to prompts.json file."""
-    return _get_resources_path() / "prompts.json"
-
-
-def _load_prompts_from_json() -> Dict[str, Dict[str, Any]]:
+    segments = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if field_name is not None and (format_spec or conversion or not field_name.isidentifier()):
+            return None
+        segments.append((literal, field_name))
+    return tuple(segments)
+
+
+def _fill_template(template: str, arguments: Mapping[str, Any]) -> str:
+    """Fill a prompt template, leaving placeholders for missing arguments as-is."""
+    segments = _compile_template(template)
+    if segments is None:
+        return template.format_map(_MissingArgumentsDict(arguments))
+    
+    parts = []
+    for literal, field_name in segments:
+        parts.append(literal)
+        if field_name is not None:
+            parts.append(format(arguments[field_name]) if field_name in arguments else "{" + field_name + "}")
+    return "".join(parts)
+
+
+# Parsed prompts.json as (path, mtime_ns, prompts, prompts list); reloaded when the file changes
+_prompts_cache: Optional[tuple[str, int, Dict[str, Dict[str, Any]], List[Dict[str, Any]]]] = None
+# Monotonic time of the last modification-time check of prompts.json
+_prompts_checked_at = 0.0
+
+
+def _load_prompts_from_json() -> tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]]]:
     """Load prompt definitions from shared JSON file.
     
+    The parsed file is memoized by path and modification time. Within
+    DEFINITIONS_REVALIDATE_INTERVAL of the last check the cached data is returned
+    without touching the file. The returned objects are shared and must not be mutated.
+    
     Returns:
-        Dictionary mapping prompt names to prompt definitions
+        Tuple of (dictionary mapping prompt names to prompt definitions, list of
+        prompt definitions), both built once per file load
     """
-    prompts_json_path = _get_prompts_json_path()
+    global _prompts_cache, _prompts_checked_at
+    prompts_json_path = get_prompts_json_path()
+    now = time.monotonic()
+    if (_prompts_cache is not None and _prompts_cache[0] == prompts_json_path
+            and now - _prompts_checked_at < DEFINITIONS_REVALIDATE_INTERVAL):
+        return _prompts_cache[2:]
     try:
-        with open(prompts_json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            prompts_list = data.get("prompts", [])
-            return {prompt["name"]: prompt for prompt in prompts_list}
+        mtime_ns = os.stat(prompts_json_path).st_mtime_ns
+        _prompts_checked_at = now
+        if _prompts_cache is not None and _prompts_cache[:2] == (prompts_json_path, mtime_ns):
+            return _prompts_cache[2:]
+        
+        data = load_definitions_json(prompts_json_path)
+        prompts_list = data.get("prompts", [])
+        prompts = {prompt["name"]: prompt for prompt in prompts_list}
+        prompts_values = list(prompts.values())
+        _prompts_cache = (prompts_json_path, mtime_ns, prompts, prompts_values)
+        return prompts, prompts_values
     except FileNotFoundError:
         raise FileNotFoundError(
             f"Prompt definitions file not found: {prompts_json_path}\n"
             f"Expected location: {prompts_json_path}\n"
-            f"Resources directory: {_get_resources_path()}\n"
+            f"Resources directory: {get_resources_path()}\n"
             f"Set UNREAL_MCP_PROXY_DEFINITIONS_PATH environment variable to specify custom path."
         )
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in prompt definitions file: {e}")
 
 
@@ -100,19 +123,34 @@ def get_prompt_definitions() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dictionary mapping prompt names to prompt definitions
     """
-    return _load_prompts_from_json()
+    return _load_prompts_from_json()[0]
 
 
 def get_cached_prompt_definitions() -> List[Dict[str, Any]]:
     """Get cached prompt definitions for offline use.
     
+    The returned list is built once per file load, shared between calls, and must
+    not be mutated.
+    
     Returns:
         List of prompt definitions
     """
-    return list(get_prompt_definitions().values())
+    return _load_prompts_from_json()[1]
+
+
+def user_text_messages(text: str) -> List[Dict[str, Any]]:
+    """Wrap prompt text in a single user message, the shape every prompt returns.
+    
+    Args:
+        text: Prompt text
+    
+    Returns:
+        List containing one user message with text content
+    """
+    return [{"role": "user", "content": {"type": "text", "text": text}}]
 
 
-def generate_prompt_messages(prompt_name: str, arguments: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+def generate_prompt_messages(prompt_name: str, arguments: Optional[Mapping[str, Any]] = None) -> List[Dict[str, Any]]:
     """Generate prompt messages for a given prompt name and arguments.
     
     Loads the prompt template from the shared JSON file and formats it with the provided arguments.
@@ -126,7 +164,7 @@ def generate_prompt_messages(prompt_name: str, arguments: Optional[Dict[str, Any
         List of prompt messages (each with role and content)
     """
     if arguments is None:
-        arguments = {}
+        arguments = _EMPTY_ARGUMENTS
     
     # Load prompt definition from JSON
     prompts = get_prompt_definitions()
@@ -139,20 +177,8 @@ def generate_prompt_messages(prompt_name: str, arguments: Optional[Dict[str, Any
     template = prompt_def.get("template", "")
     
     # Format template with arguments (simple string replacement)
-    # Handle missing arguments by leaving placeholders as-is
-    try:
-        prompt_text = template.format(**arguments)
-    except KeyError as e:
-        # If an argument is missing, use the placeholder name
-        prompt_text = template
-    
-    messages = [{
-        "role": "user",
-        "content": {
-            "type": "text",
-            "text": prompt_text
-        }
-    }]
-    
-    return messages
+    # Missing arguments leave their placeholders as-is; provided ones are still filled
+    prompt_text = _fill_template(template, arguments)
+    
+    return user_text_messages(prompt_text)
 
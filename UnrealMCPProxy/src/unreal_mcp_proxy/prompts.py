@@ -7,29 +7,10 @@ They can be used to guide LLM interactions for Blueprint analysis, asset managem
 from typing import Dict, Any, List
 from fastmcp import FastMCP
 
+from .prompt_definitions import user_text_messages
 
-def create_blueprint_analysis_prompt(mcp: FastMCP):
-    """Create a prompt for analyzing Blueprint structure and functionality."""
-    
-    @mcp.prompt()
-    def analyze_blueprint(blueprint_path: str, focus_areas: str = "all") -> List[Dict[str, Any]]:
-        """Analyze a Blueprint's structure, functionality, and design patterns.
-        
-        Args:
-            blueprint_path: The path to the Blueprint asset (e.g., '/Game/Blueprints/BP_Player')
-            focus_areas: Comma-separated list of areas to focus on: 'variables', 'functions', 'events', 'graph', 'design', or 'all'
-        
-        Returns:
-            List of prompt messages for LLM interaction
-        """
-        focus_list = [area.strip().lower() for area in focus_areas.split(",")]
-        
-        messages = [
-            {
-                "role": "user",
-                "content": {
-                    "type": "text",
-                    "text": f"""Analyze the Blueprint at path '{blueprint_path}' and provide a comprehensive analysis.
+# Prompt texts, built once at import; each call only fills in its arguments
+_ANALYZE_BLUEPRINT_TEMPLATE = """Analyze the Blueprint at path '{blueprint_path}' and provide a comprehensive analysis.
 
 Focus Areas: {focus_areas}
 
@@ -45,33 +26,8 @@ Please provide:
 9. **Suggestions**: Provide recommendations for improvements or best practices
 
 Use the export_blueprint_markdown tool to get the full Blueprint structure, then analyze it thoroughly."""
-                }
-            }
-        ]
-        
-        return messages
-
 
-def create_blueprint_refactor_prompt(mcp: FastMCP):
-    """Create a prompt for refactoring Blueprints."""
-    
-    @mcp.prompt()
-    def refactor_blueprint(blueprint_path: str, refactor_goal: str) -> List[Dict[str, Any]]:
-        """Generate a refactoring plan for a Blueprint.
-        
-        Args:
-            blueprint_path: The path to the Blueprint asset
-            refactor_goal: The goal of the refactoring (e.g., 'improve performance', 'add new feature', 'simplify structure')
-        
-        Returns:
-            List of prompt messages for LLM interaction
-        """
-        messages = [
-            {
-                "role": "user",
-                "content": {
-                    "type": "text",
-                    "text": f"""Create a refactoring plan for the Blueprint at '{blueprint_path}'.
+_REFACTOR_BLUEPRINT_TEMPLATE = """Create a refactoring plan for the Blueprint at '{blueprint_path}'.
 
 Refactoring Goal: {refactor_goal}
 
@@ -84,35 +40,8 @@ Please provide:
 6. **Migration Guide**: If applicable, provide a guide for migrating dependent assets
 
 Use the export_blueprint_markdown tool to examine the current Blueprint structure."""
-                }
-            }
-        ]
-        
-        return messages
 
-
-def create_asset_audit_prompt(mcp: FastMCP):
-    """Create a prompt for auditing project assets."""
-    
-    @mcp.prompt()
-    def audit_assets(asset_paths: str, audit_type: str = "dependencies") -> List[Dict[str, Any]]:
-        """Audit project assets for dependencies, references, or issues.
-        
-        Args:
-            asset_paths: Comma-separated list of asset paths to audit
-            audit_type: Type of audit: 'dependencies', 'references', 'unused', 'orphaned', or 'all'
-        
-        Returns:
-            List of prompt messages for LLM interaction
-        """
-        asset_list = [path.strip() for path in asset_paths.split(",")]
-        
-        messages = [
-            {
-                "role": "user",
-                "content": {
-                    "type": "text",
-                    "text": f"""Audit the following assets: {', '.join(asset_list)}
+_AUDIT_ASSETS_TEMPLATE = """Audit the following assets: {asset_paths}
 
 Audit Type: {audit_type}
 
@@ -126,34 +55,8 @@ Please provide:
 7. **Recommendations**: Suggest optimizations, cleanup opportunities, or restructuring
 
 Use the search_assets, get_asset_dependencies, and get_asset_references tools to gather information."""
-                }
-            }
-        ]
-        
-        return messages
 
-
-def create_blueprint_creation_prompt(mcp: FastMCP):
-    """Create a prompt for creating new Blueprints."""
-    
-    @mcp.prompt()
-    def create_blueprint(blueprint_name: str, parent_class: str, description: str) -> List[Dict[str, Any]]:
-        """Generate a plan for creating a new Blueprint.
-        
-        Args:
-            blueprint_name: Name for the new Blueprint (e.g., 'BP_PlayerController')
-            parent_class: Parent class to inherit from (e.g., 'PlayerController', 'Actor', 'Pawn')
-            description: Description of what the Blueprint should do
-        
-        Returns:
-            List of prompt messages for LLM interaction
-        """
-        messages = [
-            {
-                "role": "user",
-                "content": {
-                    "type": "text",
-                    "text": f"""Create a design plan for a new Blueprint named '{blueprint_name}' that inherits from '{parent_class}'.
+_CREATE_BLUEPRINT_TEMPLATE = """Create a design plan for a new Blueprint named '{blueprint_name}' that inherits from '{parent_class}'.
 
 Description: {description}
 
@@ -168,32 +71,8 @@ Please provide:
 8. **Testing Checklist**: Items to test once the Blueprint is created
 
 Use search_blueprints to find similar existing Blueprints for reference."""
-                }
-            }
-        ]
-        
-        return messages
 
-
-def create_performance_analysis_prompt(mcp: FastMCP):
-    """Create a prompt for analyzing Blueprint performance."""
-    
-    @mcp.prompt()
-    def analyze_performance(blueprint_path: str) -> List[Dict[str, Any]]:
-        """Analyze the performance characteristics of a Blueprint.
-        
-        Args:
-            blueprint_path: The path to the Blueprint asset
-        
-        Returns:
-            List of prompt messages for LLM interaction
-        """
-        messages = [
-            {
-                "role": "user",
-                "content": {
-                    "type": "text",
-                    "text": f"""Analyze the performance of the Blueprint at '{blueprint_path}'.
+_ANALYZE_PERFORMANCE_TEMPLATE = """Analyze the performance of the Blueprint at '{blueprint_path}'.
 
 Please provide:
 1. **Performance Hotspots**: Identify nodes or functions that might cause performance issues
@@ -205,11 +84,84 @@ Please provide:
 7. **Profiling Recommendations**: Suggest what to profile in Unreal's profiler
 
 Use export_blueprint_markdown to examine the Blueprint structure, then analyze it for performance concerns."""
-                }
-            }
-        ]
-        
-        return messages
+
+
+def analyze_blueprint(blueprint_path: str, focus_areas: str = "all") -> List[Dict[str, Any]]:
+    """Analyze a Blueprint's structure, functionality, and design patterns.
+    
+    Args:
+        blueprint_path: The path to the Blueprint asset (e.g., '/Game/Blueprints/BP_Player')
+        focus_areas: Comma-separated list of areas to focus on: 'variables', 'functions', 'events', 'graph', 'design', or 'all'
+    
+    Returns:
+        List of prompt messages for LLM interaction
+    """
+    return user_text_messages(_ANALYZE_BLUEPRINT_TEMPLATE.format(blueprint_path=blueprint_path, focus_areas=focus_areas))
+
+
+def refactor_blueprint(blueprint_path: str, refactor_goal: str) -> List[Dict[str, Any]]:
+    """Generate a refactoring plan for a Blueprint.
+    
+    Args:
+        blueprint_path: The path to the Blueprint asset
+        refactor_goal: The goal of the refactoring (e.g., 'improve performance', 'add new feature', 'simplify structure')
+    
+    Returns:
+        List of prompt messages for LLM interaction
+    """
+    return user_text_messages(_REFACTOR_BLUEPRINT_TEMPLATE.format(blueprint_path=blueprint_path, refactor_goal=refactor_goal))
+
+
+def audit_assets(asset_paths: str, audit_type: str = "dependencies") -> List[Dict[str, Any]]:
+    """Audit project assets for dependencies, references, or issues.
+    
+    Args:
+        asset_paths: Comma-separated list of asset paths to audit
+        audit_type: Type of audit: 'dependencies', 'references', 'unused', 'orphaned', or 'all'
+    
+    Returns:
+        List of prompt messages for LLM interaction
+    """
+    return user_text_messages(_AUDIT_ASSETS_TEMPLATE.format(
+        asset_paths=", ".join(path.strip() for path in asset_paths.split(",")),
+        audit_type=audit_type
+    ))
+
+
+def create_blueprint(blueprint_name: str, parent_class: str, description: str) -> List[Dict[str, Any]]:
+    """Generate a plan for creating a new Blueprint.
+    
+    Args:
+        blueprint_name: Name for the new Blueprint (e.g., 'BP_PlayerController')
+        parent_class: Parent class to inherit from (e.g., 'PlayerController', 'Actor', 'Pawn')
+        description: Description of what the Blueprint should do
+    
+    Returns:
+        List of prompt messages for LLM interaction
+    """
+    return user_text_messages(_CREATE_BLUEPRINT_TEMPLATE.format(blueprint_name=blueprint_name, parent_class=parent_class, description=description))
+
+
+def analyze_performance(blueprint_path: str) -> List[Dict[str, Any]]:
+    """Analyze the performance characteristics of a Blueprint.
+    
+    Args:
+        blueprint_path: The path to the Blueprint asset
+    
+    Returns:
+        List of prompt messages for LLM interaction
+    """
+    return user_text_messages(_ANALYZE_PERFORMANCE_TEMPLATE.format(blueprint_path=blueprint_path))
+
+
+# (name, handler) pairs for every example prompt, kept for reference only
+PROMPTS = [
+    ("analyze_blueprint", analyze_blueprint),
+    ("refactor_blueprint", refactor_blueprint),
+    ("audit_assets", audit_assets),
+    ("create_blueprint", create_blueprint),
+    ("analyze_performance", analyze_performance),
+]
 
 
 def register_all_prompts(mcp: FastMCP):
@@ -218,8 +170,7 @@ def register_all_prompts(mcp: FastMCP):
     Note: These prompts are examples. The actual prompts will come from the backend.
     This function is kept for reference but prompts should be registered by the backend.
     """
-    # Prompts are registered via decorators in the functions above
-    # In practice, prompts should be registered by the backend server
+    # Prompts are served from prompts.json via server.py's @mcp.prompt() handlers;
+    # registering these examples as well would conflict with those names.
     # This function is a placeholder for documentation
     pass
-
@@ -15,85 +15,109 @@ Path Configuration:
   - Relative path from plugin root: ../CustomResources
 """
 
-import json
 import os
-from pathlib import Path
-from typing import Dict, Any, List
-
-# Lazy loading of settings to avoid circular imports
-_settings_cache = None
-
-def _get_settings():
-    """Lazily load settings to avoid circular import issues."""
-    global _settings_cache
-    if _settings_cache is None:
-        try:
-            from .config import ServerSettings
-            _settings_cache = ServerSettings()
-        except (ImportError, Exception):
-            _settings_cache = None
-    return _settings_cache
-
-
-def _get_resources_path() -> Path:
-    """Get the path to the Resources directory containing JSON definitions.
-    
-    Uses environment variable if set, otherwise defaults to relative path
-    from plugin root: ../Resources
-    
-    Returns:
-        Path to Resources directory
-    """
-    # This file is in: UnrealMCPProxy/src/unreal_mcp_proxy/resource_definitions.py
-    # Plugin root is: UnrealMCPProxy/ (parent of src/)
-    _current_file = Path(__file__).resolve()
-    _plugin_root = _current_file.parent.parent.parent  # Go up to UnrealMCPProxy/
-    
-    # Get definitions path from settings or environment
-    settings = _get_settings()
-    if settings and settings.definitions_path:
-        definitions_path_str = settings.definitions_path
-    else:
-        definitions_path_str = os.getenv("UNREAL_MCP_PROXY_DEFINITIONS_PATH")
-    
-    if definitions_path_str:
-        # User-specified path (absolute or relative to plugin root)
-        definitions_path = Path(definitions_path_str)
-        if not definitions_path.is_absolute():
-            # Relative path - resolve from plugin root
-            definitions_path = _plugin_root.parent / definitions_path
-        return definitions_path
-    else:
-        # Default: relative path ../Resources from plugin root
-        return _plugin_root.parent / "Resources"
+import time
+from typing import Dict, Any, List, Optional
+
+import orjson
 
+from .definitions_paths import (
+    DEFINITIONS_REVALIDATE_INTERVAL, get_settings, get_resources_path, get_resources_json_path,
+    load_definitions_json
+)
 
-def _get_resources_json_path() -> Path:
-    """Get the path to resources.json file."""
-    return _get_resources_path() / "resources.json"
+
+# Parsed resources.json as (path, mtime_ns, data); reloaded when the file changes
+_resources_cache: Optional[tuple[str, int, Dict[str, Any]]] = None
+# Monotonic time of the last modification-time check of resources.json
+_resources_checked_at = 0.0
 
 
 def _load_resources_from_json() -> Dict[str, Any]:
     """Load resource definitions from shared JSON file.
     
+    The parsed file is memoized by path and modification time. Within
+    DEFINITIONS_REVALIDATE_INTERVAL of the last check the cached data is returned
+    without touching the file. The returned dictionary is shared and must not be mutated.
+    
     Returns:
         Dictionary with 'resources' and 'resourceTemplates' keys
     """
-    resources_json_path = _get_resources_json_path()
+    global _resources_cache, _resources_checked_at
+    resources_json_path = get_resources_json_path()
+    now = time.monotonic()
+    if (_resources_cache is not None and _resources_cache[0] == resources_json_path
+            and now - _resources_checked_at < DEFINITIONS_REVALIDATE_INTERVAL):
+        return _resources_cache[2]
     try:
-        with open(resources_json_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        mtime_ns = os.stat(resources_json_path).st_mtime_ns
+        _resources_checked_at = now
+        if _resources_cache is not None and _resources_cache[:2] == (resources_json_path, mtime_ns):
+            return _resources_cache[2]
+        
+        data = load_definitions_json(resources_json_path)
+        _resources_cache = (resources_json_path, mtime_ns, data)
+        return data
     except FileNotFoundError:
         raise FileNotFoundError(
             f"Resource definitions file not found: {resources_json_path}\n"
             f"Expected location: {resources_json_path}\n"
-            f"Resources directory: {_get_resources_path()}\n"
+            f"Resources directory: {get_resources_path()}\n"
             f"Set UNREAL_MCP_PROXY_DEFINITIONS_PATH environment variable to specify custom path."
         )
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in resource definitions file: {e}")
 
 
+# Views derived from the parsed resources.json, each a tuple of
+# (resources by URI, resource templates, get_cached_resource_definitions() result):
+# (data, views including markdown templates, views excluding them)
+_ResourceViews = tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any]]
+_resource_views_cache: Optional[tuple[Dict[str, Any], _ResourceViews, _ResourceViews]] = None
+
+# URI scheme prefix of markdown resource templates (require markdown export)
+_MARKDOWN_URI_PREFIX = "unreal+md://"
+
+
+def _load_resource_views() -> _ResourceViews:
+    """Build the resource views from resources.json.
+    
+    The views are built once per file load, both including and excluding markdown
+    templates, so each call only picks one by the markdown export setting. The
+    returned objects are shared and must not be mutated.
+    
+    Returns:
+        Tuple of (resources keyed by URI, resource templates, cached definitions dict)
+    """
+    global _resource_views_cache
+    data = _load_resources_from_json()
+    
+    cache = _resource_views_cache
+    if cache is None or cache[0] is not data:
+        # Convert list to dict keyed by URI
+        resources = {
+            resource["uri"]: resource for resource in data.get("resources", []) if resource.get("uri")
+        }
+        resources_list = list(resources.values())
+        templates = data.get("resourceTemplates", [])
+        templates_without_markdown = [
+            template for template in templates
+            if not template.get("uriTemplate", "").startswith(_MARKDOWN_URI_PREFIX)
+        ]
+        cache = _resource_views_cache = (
+            data,
+            (resources, templates, {"resources": resources_list, "resourceTemplates": templates}),
+            (resources, templates_without_markdown,
+             {"resources": resources_list, "resourceTemplates": templates_without_markdown})
+        )
+    
+    # Filter out markdown resources if markdown export is disabled
+    settings = get_settings()
+    if settings and not settings.enable_markdown_export:
+        return cache[2]
+    return cache[1]
+
+
 def get_resource_definitions() -> Dict[str, Dict[str, Any]]:
     """Get all static resource definitions (metadata only, not content).
     
@@ -102,10 +126,7 @@ def get_resource_definitions() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dictionary mapping resource URIs to resource definitions (metadata only)
     """
-    data = _load_resources_from_json()
-    resources_list = data.get("resources", [])
-    # Convert list to dict keyed by URI
-    return {resource.get("uri", ""): resource for resource in resources_list if resource.get("uri")}
+    return _load_resource_views()[0]
 
 
 def get_resource_template_definitions() -> List[Dict[str, Any]]:
@@ -120,18 +141,7 @@ def get_resource_template_definitions() -> List[Dict[str, Any]]:
     Returns:
         List of resource template definitions (metadata: name, description, uriTemplate, mimeType)
     """
-    data = _load_resources_from_json()
-    templates = data.get("resourceTemplates", [])
-    
-    # Filter out markdown resources if markdown export is disabled
-    settings = _get_settings()
-    if settings and not settings.enable_markdown_export:
-        templates = [
-            template for template in templates
-            if not template.get("uriTemplate", "").startswith("unreal+md://")
-        ]
-    
-    return templates
+    return _load_resource_views()[1]
 
 
 def get_cached_resource_definitions() -> Dict[str, Any]:
@@ -140,11 +150,10 @@ def get_cached_resource_definitions() -> Dict[str, Any]:
     NOTE: This caches METADATA ONLY (definitions, templates, descriptions).
     Resource content is never cached and must be fetched from the backend.
     
+    The returned dictionary is shared between calls and must not be mutated.
+    
     Returns:
         Dictionary with resources and resourceTemplates lists (metadata only)
     """
-    return {
-        "resources": list(get_resource_definitions().values()),
-        "resourceTemplates": get_resource_template_definitions()
-    }
+    return _load_resource_views()[2]
 
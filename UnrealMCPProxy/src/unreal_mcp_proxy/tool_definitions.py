@@ -9,7 +9,7 @@ to match the backend structure. See individual domain files for details.
 See .cursorrules for synchronization requirements.
 """
 
-import json
+import functools
 from typing import Dict, Any, Optional
 
 from .tool_definitions_common import get_common_tools
@@ -17,11 +17,13 @@ from .tool_definitions_asset import get_asset_tools
 from .tool_definitions_blueprint import get_blueprint_tools
 
 
+@functools.lru_cache(maxsize=4)
 def get_tool_definitions(enable_markdown_export: bool = True) -> Dict[str, Dict[str, Any]]:
     """Get all tool definitions with conditional features applied.
     
     Combines tool definitions from all domains (Common, Asset, Blueprint)
-    to match the backend structure.
+    to match the backend structure. Results are memoized per flag value, so
+    callers share the returned dictionary and must not mutate it.
     
     Args:
         enable_markdown_export: Whether to include markdown export support in descriptions
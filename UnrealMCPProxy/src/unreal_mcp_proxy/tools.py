@@ -1,16 +1,22 @@
 """Tool handling and execution logic for UnrealMCPProxy."""
 
 import asyncio
-import json
 import logging
 from typing import Dict, Any, Optional
 
+import orjson
+
 from .client.unreal_mcp import UnrealMCPClient, ConnectionState
 from .errors import create_error_response
 from .config import ServerSettings
+from .constants import BACKEND_UNAVAILABLE_MESSAGE
 
 logger = logging.getLogger(__name__)
 
+# Built once: returned for every tool call while the backend is offline, and
+# never mutated by callers
+_BACKEND_UNAVAILABLE_RESPONSE = create_error_response(BACKEND_UNAVAILABLE_MESSAGE)
+
 
 def is_read_only_tool(
     tool_name: str,
@@ -118,13 +124,13 @@ async def call_tool_with_retry(
     
     if not is_read_only:
         # For write operations, call once without retry - NEVER retry write operations
-        logger.debug(f"Tool '{tool_name}' is a write operation - calling once without retry (no retries on any errors)")
+        logger.debug("Tool '%s' is a write operation - calling once without retry (no retries on any errors)", tool_name)
         try:
             response = await client.call_tool(tool_name, arguments)
             return response
         except Exception as e:
             # For write operations, never retry - just raise the exception immediately
-            logger.error(f"Tool '{tool_name}' (write operation) failed - not retrying: {str(e)}", exc_info=True)
+            logger.error("Tool '%s' (write operation) failed - not retrying: %s", tool_name, e, exc_info=True)
             raise
     
     # For read-only operations, retry on transient errors
@@ -136,7 +142,7 @@ async def call_tool_with_retry(
             response = await client.call_tool(tool_name, arguments)
             # Success - return immediately
             if attempt > 0:
-                logger.info(f"Tool '{tool_name}' succeeded on retry attempt {attempt + 1}")
+                logger.info("Tool '%s' succeeded on retry attempt %s", tool_name, attempt + 1)
             return response
             
         except (ConnectionError, TimeoutError) as e:
@@ -160,7 +166,7 @@ async def call_tool_with_retry(
         
         except Exception as e:
             # Non-transient error - don't retry
-            logger.error(f"Non-transient error calling tool '{tool_name}': {str(e)}", exc_info=True)
+            logger.error("Non-transient error calling tool '%s': %s", tool_name, e, exc_info=True)
             raise
     
     # Should never reach here, but just in case
@@ -169,11 +175,12 @@ async def call_tool_with_retry(
     raise RuntimeError(f"Unexpected retry loop exit for tool '{tool_name}'")
 
 
-async def handle_tool_result(tool_name: str, result: Dict[str, Any]) -> Dict[str, Any]:
+def handle_tool_result_sync(tool_name: str, result: Dict[str, Any]) -> Dict[str, Any]:
     """Handle tool result from backend, converting MCP format to return value.
     
     Returns error dictionaries (with isError: True) instead of raising exceptions
-    to maintain consistency with FastMCP's expected return format.
+    to maintain consistency with FastMCP's expected return format. The conversion
+    is CPU-only, so tool functions call this directly instead of awaiting.
     
     Args:
         tool_name: Name of the tool that was called
@@ -186,22 +193,22 @@ async def handle_tool_result(tool_name: str, result: Dict[str, Any]) -> Dict[str
         error_content = result.get("content", [{}])[0]
         error_text = error_content.get("text", "{}")
         try:
-            error_data = json.loads(error_text)
+            error_data = orjson.loads(error_text)
             error_message = error_data.get("error", "Unknown error")
             error_code = error_data.get("code")
             return create_error_response(error_message, error_code)
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return create_error_response(error_text)
     
     content = result.get("content", [{}])[0]
     if content.get("type") == "text":
         try:
-            parsed_result = json.loads(content.get("text", "{}"))
+            parsed_result = orjson.loads(content.get("text", "{}"))
             if isinstance(parsed_result, dict) and parsed_result.get("bSuccess") is False:
                 error_msg = parsed_result.get("error", "Operation failed")
                 return create_error_response(error_msg)
             return parsed_result
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return {"text": content.get("text", "")}
     return result
 
@@ -227,12 +234,12 @@ async def call_tool(
     Returns:
         Tool result with content array
     """
-    logger.info(f"Tool call requested: {tool_name}")
+    logger.info("Tool call requested: %s", tool_name)
     
     # Lazy initialization: start health check and compatibility checking if not already started
     # This ensures initialization happens on first tool call if it wasn't done at startup
     # Can be disabled via settings.health_check_start_on_first_call = False
-    if settings.health_check_start_on_first_call and not client._health_check_started:
+    if settings.health_check_start_on_first_call and not client._initialized:
         try:
             await client.initialize_async()
             # Check compatibility when backend comes online
@@ -244,14 +251,17 @@ async def call_tool(
     
     # Check if tool exists in proxy tool definitions (even if offline)
     if cached_proxy_tool_definitions and tool_name not in cached_proxy_tool_definitions:
-        logger.warning(f"Tool '{tool_name}' not found in proxy tool definitions")
+        logger.warning("Tool '%s' not found in proxy tool definitions", tool_name)
         return create_error_response(f"Tool '{tool_name}' not found")
     
+    if client.state == ConnectionState.OFFLINE and client._initialized and not client._health_check_started:
+        # Without the background health check nothing else revalidates an offline
+        # backend, so probe before rejecting the call
+        await client.ping()
+    
     if client.state == ConnectionState.OFFLINE:
-        logger.warning(f"Backend unavailable for tool call '{tool_name}'")
-        return create_error_response(
-            "Unreal MCP server is not available. Please ensure Unreal Editor is running and the UnrealMCPServer plugin is enabled."
-        )
+        logger.warning("Backend unavailable for tool call '%s'", tool_name)
+        return _BACKEND_UNAVAILABLE_RESPONSE
     
     try:
         # Use retry logic for read-only operations
@@ -275,16 +285,16 @@ async def call_tool(
         
         # Extract result from response
         result = response.get("result", {})
-        logger.info(f"Tool call '{tool_name}' succeeded")
+        logger.info("Tool call '%s' succeeded", tool_name)
         return result
         
     except ConnectionError as e:
-        logger.error(f"Connection error calling tool '{tool_name}': {str(e)}", exc_info=True)
+        logger.error("Connection error calling tool '%s': %s", tool_name, e, exc_info=True)
         return create_error_response(f"Failed to connect to Unreal MCP server: {str(e)}", "connection_error")
     except TimeoutError as e:
-        logger.warning(f"Timeout calling tool '{tool_name}' (timeout={settings.backend_timeout}s)")
+        logger.warning("Timeout calling tool '%s' (timeout=%ss)", tool_name, settings.backend_timeout)
         return create_error_response(f"Request to Unreal MCP server timed out: {str(e)}", "timeout_error")
     except Exception as e:
-        logger.error(f"Error calling tool '{tool_name}': {str(e)}", exc_info=True)
+        logger.error("Error calling tool '%s': %s", tool_name, e, exc_info=True)
         return create_error_response(f"Failed to call tool: {str(e)}", "internal_error")
 
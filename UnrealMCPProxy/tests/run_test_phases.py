@@ -128,8 +128,8 @@ async def check_backend_online() -> bool:
     """Check if backend is online by making an actual connection test."""
     client = UnrealMCPClient()
     try:
-        # Initialize the client (performs immediate connection check)
-        await client.initialize_async()
+        # Initialize the client (performs immediate connection check, no health check loop)
+        await client.initialize_async(start_health_check=False)
         
         # After initialization, state should be set immediately
         # But also verify with an actual call to be sure
@@ -57,8 +57,9 @@ async def create_test_client() -> UnrealMCPClient:
         UnrealMCPClient instance ready for testing
     """
     client = UnrealMCPClient()
-    # Initialize async components (performs immediate connection check)
-    await client.initialize_async()
+    # Initialize async components (performs immediate connection check).
+    # Test clients are short-lived, so the background health check is not started.
+    await client.initialize_async(start_health_check=False)
     return client
 
 
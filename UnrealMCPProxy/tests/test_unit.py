@@ -4,11 +4,15 @@ These tests use mocks to test functions in isolation without requiring
 a running backend or full integration setup.
 """
 
+import asyncio
+import os
 import sys
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 import pytest
 import json
+import httpx
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -17,11 +21,15 @@ from unreal_mcp_proxy.tool_definitions import compare_tool_definitions
 from unreal_mcp_proxy.tools import (
     is_read_only_tool,
     is_transient_error,
-    handle_tool_result,
-    call_tool_with_retry
+    handle_tool_result_sync,
+    call_tool_with_retry,
+    call_tool
 )
 from unreal_mcp_proxy.errors import create_error_response
 from unreal_mcp_proxy.tool_decorators import read_only, write_operation, get_tool_read_only_flag
+from unreal_mcp_proxy.client.unreal_mcp import UnrealMCPClient, UnrealMCPSettings, ConnectionState
+from unreal_mcp_proxy.config import ServerSettings, MCPTransport, setup_event_loop
+from unreal_mcp_proxy.prompt_definitions import generate_prompt_messages
 
 
 # ============================================================================
@@ -116,6 +124,53 @@ def test_compare_tool_definitions_type_mismatch():
     assert len(issues) > 0, "Expected issues for type mismatch"
 
 
+def test_compare_all_memoizes_unchanged_tools():
+    """Test that re-comparing unchanged tool definitions hits the comparison memo."""
+    from unreal_mcp_proxy import compatibility
+    
+    proxy = {"name": "memo_tool", "inputSchema": {"type": "object", "properties": {"a": {"type": "string"}}}}
+    backend = {"name": "memo_tool", "inputSchema": {"properties": {"a": {"type": "string"}}, "type": "object"}}
+    changed = {"name": "memo_tool", "inputSchema": {"type": "object", "properties": {"a": {"type": "number"}}}}
+    
+    compatibility._comparison_cache.clear()
+    with patch.object(compatibility, "compare_tool_definitions", wraps=compare_tool_definitions) as compare:
+        first = compatibility._compare_all([(proxy, backend)])
+        second = compatibility._compare_all([(proxy, dict(backend))])
+        assert compare.call_count == 1
+        compatibility._compare_all([(proxy, changed)])
+        assert compare.call_count == 2
+    
+    assert first == second == [()]
+
+
+@pytest.mark.asyncio
+async def test_check_tool_compatibility_reports_unchanged_catalog(caplog):
+    """Test that an unchanged backend catalog skips comparison but still reports issues."""
+    from unreal_mcp_proxy import compatibility
+    
+    proxy_definitions = {"memo_tool": {"name": "memo_tool", "inputSchema": {"type": "object", "properties": {}}}}
+    backend_tool = {
+        "name": "memo_tool",
+        "inputSchema": {"type": "object", "properties": {"a": {"type": "string"}}, "required": ["a"]}
+    }
+    mock_client = Mock()
+    mock_client.state = ConnectionState.ONLINE
+    mock_client.get_tools_list = AsyncMock(return_value={"result": {"tools": [backend_tool]}})
+    
+    compatibility._last_check = None
+    with patch.object(compatibility, "_compare_all", wraps=compatibility._compare_all) as compare_all:
+        for _ in range(2):
+            caplog.clear()
+            await compatibility.check_tool_compatibility(mock_client, proxy_definitions)
+            assert "Schema compatibility issue detected for 'memo_tool'" in caplog.text
+            assert "1 compatibility issue(s) detected" in caplog.text
+        assert compare_all.call_count == 1
+        
+        # An equal but distinct definitions object is compared again
+        await compatibility.check_tool_compatibility(mock_client, dict(proxy_definitions))
+        assert compare_all.call_count == 2
+
+
 # ============================================================================
 # Test is_read_only_tool
 # ============================================================================
@@ -179,8 +234,7 @@ def test_is_transient_error_other():
 # Test handle_tool_result
 # ============================================================================
 
-@pytest.mark.asyncio
-async def test_handle_tool_result_success():
+def test_handle_tool_result_success():
     """Test handling successful tool result."""
     result = {
         "content": [{
@@ -189,12 +243,11 @@ async def test_handle_tool_result_success():
         }]
     }
     
-    output = await handle_tool_result("test_tool", result)
+    output = handle_tool_result_sync("test_tool", result)
     assert output == {"success": True, "data": "test"}
 
 
-@pytest.mark.asyncio
-async def test_handle_tool_result_error():
+def test_handle_tool_result_error():
     """Test handling error result."""
     result = {
         "isError": True,
@@ -204,13 +257,12 @@ async def test_handle_tool_result_error():
         }]
     }
     
-    output = await handle_tool_result("test_tool", result)
+    output = handle_tool_result_sync("test_tool", result)
     assert output.get("isError") is True
     assert "error" in output.get("content", [{}])[0].get("text", "")
 
 
-@pytest.mark.asyncio
-async def test_handle_tool_result_bSuccess_false():
+def test_handle_tool_result_bSuccess_false():
     """Test handling result with bSuccess=False."""
     result = {
         "content": [{
@@ -219,10 +271,23 @@ async def test_handle_tool_result_bSuccess_false():
         }]
     }
     
-    output = await handle_tool_result("test_tool", result)
+    output = handle_tool_result_sync("test_tool", result)
     assert output.get("isError") is True
 
 
+def test_handle_tool_result_sync_plain_text():
+    """Test that non-JSON result text is returned as a text field without awaiting."""
+    result = {
+        "content": [{
+            "type": "text",
+            "text": "plain output"
+        }]
+    }
+    
+    output = handle_tool_result_sync("test_tool", result)
+    assert output == {"text": "plain output"}
+
+
 # ============================================================================
 # Test create_error_response
 # ============================================================================
@@ -364,6 +429,408 @@ async def test_call_tool_with_retry_write_operation_no_retry():
     assert mock_client.call_tool.call_count == 1
 
 
+# ============================================================================
+# Test ServerSettings
+# ============================================================================
+
+def test_server_settings_transport_case_insensitive():
+    """Test that transport names are accepted regardless of case."""
+    assert ServerSettings(transport="HTTP").transport == MCPTransport.http
+    assert ServerSettings(transport=MCPTransport.sse).transport == MCPTransport.sse
+
+
+def test_setup_event_loop_installs_eager_task_factory():
+    """Test that loops created after setup_event_loop() use eager tasks where available."""
+    previous_policy = asyncio.get_event_loop_policy()
+    try:
+        setup_event_loop()
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.get_task_factory() is getattr(asyncio, "eager_task_factory", None)
+        finally:
+            loop.close()
+    finally:
+        asyncio.set_event_loop_policy(previous_policy)
+
+
+# ============================================================================
+# Test prompt generation
+# ============================================================================
+
+def test_generate_prompt_messages_partial_arguments():
+    """Test that provided arguments are filled in even when others are missing."""
+    messages = generate_prompt_messages("refactor_blueprint", {"blueprint_path": "/Game/BP_Test"})
+    text = messages[0]["content"]["text"]
+    assert "/Game/BP_Test" in text
+    assert "{refactor_goal}" in text
+
+
+# ============================================================================
+# Test definitions file loading
+# ============================================================================
+
+def test_load_definitions_json_large_file_uses_mmap(tmp_path):
+    """Test that definition files above the mmap threshold are parsed from a mapping."""
+    from unreal_mcp_proxy import definitions_paths
+    
+    data = {"prompts": [{"name": f"prompt_{i}", "description": "x" * 100} for i in range(1000)]}
+    definitions_file = tmp_path / "prompts.json"
+    definitions_file.write_text(json.dumps(data))
+    assert definitions_file.stat().st_size >= definitions_paths._MMAP_THRESHOLD
+    
+    with patch.object(definitions_paths.mmap, "mmap", wraps=definitions_paths.mmap.mmap) as mapped:
+        loaded = definitions_paths.load_definitions_json(str(definitions_file))
+    
+    assert mapped.call_count == 1
+    assert loaded == data
+
+
+def test_prompt_definitions_revalidate_window(tmp_path):
+    """Test that prompts.json is re-checked only after the revalidate window and reloaded on change."""
+    from unreal_mcp_proxy import prompt_definitions
+    
+    prompts_file = tmp_path / "prompts.json"
+    prompts_file.write_text(json.dumps({"prompts": [{"name": "first"}]}))
+    mtime_ns = prompts_file.stat().st_mtime_ns
+    clock = Mock(return_value=100.0)
+    
+    with patch.object(prompt_definitions, "_prompts_cache", None), \
+            patch.object(prompt_definitions, "get_prompts_json_path", return_value=str(prompts_file)), \
+            patch.object(prompt_definitions.time, "monotonic", clock), \
+            patch.object(prompt_definitions.os, "stat", wraps=os.stat) as stat, \
+            patch.object(prompt_definitions, "load_definitions_json",
+                         wraps=prompt_definitions.load_definitions_json) as load:
+        first = prompt_definitions.get_prompt_definitions()
+        assert list(first) == ["first"]
+        assert (stat.call_count, load.call_count) == (1, 1)
+        
+        # Within the window: served without touching the file
+        clock.return_value = 100.0 + prompt_definitions.DEFINITIONS_REVALIDATE_INTERVAL / 2
+        assert prompt_definitions.get_prompt_definitions() is first
+        assert (stat.call_count, load.call_count) == (1, 1)
+        
+        # Window elapsed, file unchanged: stat only
+        clock.return_value = 110.0
+        assert prompt_definitions.get_prompt_definitions() is first
+        assert (stat.call_count, load.call_count) == (2, 1)
+        
+        # Modification time changed: reloaded
+        prompts_file.write_text(json.dumps({"prompts": [{"name": "second"}]}))
+        os.utime(prompts_file, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+        clock.return_value = 120.0
+        assert list(prompt_definitions.get_prompt_definitions()) == ["second"]
+        assert (stat.call_count, load.call_count) == (3, 2)
+
+
+def test_resource_definitions_revalidate_window(tmp_path):
+    """Test that resources.json is re-checked only after the revalidate window and reloaded on change."""
+    from unreal_mcp_proxy import resource_definitions
+    
+    resources_file = tmp_path / "resources.json"
+    resources_file.write_text(json.dumps({"resources": [{"uri": "unreal+test://first"}], "resourceTemplates": []}))
+    mtime_ns = resources_file.stat().st_mtime_ns
+    clock = Mock(return_value=100.0)
+    
+    with patch.object(resource_definitions, "_resources_cache", None), \
+            patch.object(resource_definitions, "get_resources_json_path", return_value=str(resources_file)), \
+            patch.object(resource_definitions.time, "monotonic", clock), \
+            patch.object(resource_definitions.os, "stat", wraps=os.stat) as stat, \
+            patch.object(resource_definitions, "load_definitions_json",
+                         wraps=resource_definitions.load_definitions_json) as load:
+        first = resource_definitions.get_resource_definitions()
+        assert list(first) == ["unreal+test://first"]
+        assert (stat.call_count, load.call_count) == (1, 1)
+        
+        # Within the window: served without touching the file
+        clock.return_value = 100.0 + resource_definitions.DEFINITIONS_REVALIDATE_INTERVAL / 2
+        assert resource_definitions.get_resource_definitions() is first
+        assert (stat.call_count, load.call_count) == (1, 1)
+        
+        # Window elapsed, file unchanged: stat only
+        clock.return_value = 110.0
+        assert resource_definitions.get_resource_definitions() is first
+        assert (stat.call_count, load.call_count) == (2, 1)
+        
+        # Modification time changed: reloaded
+        resources_file.write_text(json.dumps({"resources": [{"uri": "unreal+test://second"}], "resourceTemplates": []}))
+        os.utime(resources_file, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+        clock.return_value = 120.0
+        assert list(resource_definitions.get_resource_definitions()) == ["unreal+test://second"]
+        assert (stat.call_count, load.call_count) == (3, 2)
+
+
+# ============================================================================
+# Test UnrealMCPClient (with mock transport)
+# ============================================================================
+
+def _make_mock_client(handler, settings=None):
+    """Create an UnrealMCPClient whose HTTP client uses an httpx.MockTransport."""
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = UnrealMCPClient(settings=settings or UnrealMCPSettings(), http_client=http_client)
+    # The mock HTTP client is not shared, so let the client close it
+    client._owns_http_client = True
+    return client
+
+
+@pytest.mark.asyncio
+async def test_client_call_method_round_trip():
+    """Test that call_method serializes the request and parses the response."""
+    requests = []
+    
+    def handler(request):
+        body = json.loads(request.content)
+        requests.append(body)
+        assert request.headers["content-type"] == "application/json"
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": body["id"], "result": {"ok": True}})
+    
+    client = _make_mock_client(handler)
+    try:
+        first = await client.call_method("tools/list")
+        second = await client.call_method("tools/call", {"name": "test_tool", "arguments": {}})
+    finally:
+        await client.close()
+    
+    assert first["result"] == {"ok": True}
+    assert second["result"] == {"ok": True}
+    assert requests[0]["method"] == "tools/list"
+    assert "params" not in requests[0]
+    assert requests[1]["params"] == {"name": "test_tool", "arguments": {}}
+    assert requests[1]["id"] > requests[0]["id"]
+    assert client.state == ConnectionState.ONLINE
+    assert abs(client.last_known_good_connection - time.time()) < 5
+
+
+@pytest.mark.asyncio
+async def test_client_coalesces_concurrent_list_calls():
+    """Test that concurrent identical list calls share a single backend request."""
+    requests = []
+    
+    async def handler(request):
+        body = json.loads(request.content)
+        requests.append(body)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": body["id"], "result": {"tools": []}})
+    
+    client = _make_mock_client(handler)
+    try:
+        results = await asyncio.gather(*(client.get_tools_list() for _ in range(5)))
+        await asyncio.gather(client.read_resource("unreal+t3d:///Game/A"), client.read_resource("unreal+t3d:///Game/A"))
+        await asyncio.gather(client.read_resource("unreal+t3d:///Game/A"), client.read_resource("unreal+t3d:///Game/B"))
+        await client.call_tool("test_tool", {})
+        await client.call_tool("test_tool", {})
+    finally:
+        await client.close()
+    
+    assert all(result["result"] == {"tools": []} for result in results)
+    assert [body["method"] for body in requests] == [
+        "tools/list",
+        "resources/read",
+        "resources/read",
+        "resources/read",
+        "tools/call",
+        "tools/call",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_client_shared_http_client_left_open():
+    """Test that clients sharing an injected HTTP client use it and don't close it."""
+    urls = []
+    
+    def handler(request):
+        urls.append(str(request.url))
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": 1, "result": {}})
+    
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    first = UnrealMCPClient(settings=UnrealMCPSettings(port=30001), http_client=http_client)
+    second = UnrealMCPClient(settings=UnrealMCPSettings(port=30002), http_client=http_client)
+    try:
+        await first.call_method("tools/call", {"name": "test_tool", "arguments": {}})
+        await second.call_method("tools/call", {"name": "test_tool", "arguments": {}})
+        await first.close()
+        assert not http_client.is_closed
+    finally:
+        await second.close()
+        await http_client.aclose()
+    
+    assert urls == [first.base_url, second.base_url]
+
+
+@pytest.mark.asyncio
+async def test_client_ping_uses_fresh_traffic():
+    """Test that recent successful traffic answers ping() without a backend request."""
+    methods = []
+    
+    def handler(request):
+        body = json.loads(request.content)
+        methods.append(body["method"])
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": body["id"], "result": {}})
+    
+    client = _make_mock_client(handler)
+    try:
+        assert client._needs_health_ping()  # State unknown - must probe
+        await client.call_method("tools/call", {"name": "test_tool", "arguments": {}})
+        assert not client._needs_health_ping()
+        assert await client.ping()
+        
+        # Once the fresh window has passed, ping() goes to the backend again
+        client._fresh_until = 0.0
+        assert client._needs_health_ping()
+        assert await client.ping()
+    finally:
+        await client.close()
+    
+    assert methods == ["tools/call", "ping"]
+
+
+@pytest.mark.asyncio
+async def test_client_initial_check_opens_caching_window():
+    """Test that health pings are skipped only while fresh and keep running for an idle proxy."""
+    def handler(request):
+        body = json.loads(request.content)
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": body["id"], "result": {}})
+    
+    client = _make_mock_client(handler)
+    try:
+        await client.initialize_async(start_health_check=False)
+        assert client.state == ConnectionState.ONLINE
+        assert not client._needs_health_ping()  # Fresh
+        
+        client._fresh_until = asyncio.get_running_loop().time() - 1.0
+        assert client._needs_health_ping()  # No longer fresh - health check revalidates
+        
+        # A successful health ping doesn't refresh the window, so an idle proxy keeps
+        # pinging and notices an editor that goes away
+        assert await client.ping()
+        assert client._needs_health_ping()
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_ping_non_200_marks_offline():
+    """Test that a ping answered with a non-200 status marks the backend offline."""
+    def handler(request):
+        return httpx.Response(503)
+    
+    client = _make_mock_client(handler)
+    try:
+        client.state = ConnectionState.ONLINE
+        assert not await client.ping()
+        assert client.state == ConnectionState.OFFLINE
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_wait_until_online():
+    """Test that wait_until_online wakes when the state turns ONLINE and times out otherwise."""
+    client = UnrealMCPClient(settings=UnrealMCPSettings())
+    try:
+        assert not await client.wait_until_online(0.01)
+        
+        waiter = asyncio.create_task(client.wait_until_online(5))
+        await asyncio.sleep(0)
+        client.state = ConnectionState.ONLINE
+        assert await waiter
+        
+        client.state = ConnectionState.OFFLINE
+        assert not await client.wait_until_online(0.01)
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_limits_inflight_requests():
+    """Test that concurrent backend requests are capped at max_inflight_requests."""
+    active = 0
+    peak = 0
+    
+    async def handler(request):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        body = json.loads(request.content)
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": body["id"], "result": {}})
+    
+    client = _make_mock_client(handler, UnrealMCPSettings(max_inflight_requests=2))
+    try:
+        results = await asyncio.gather(*(
+            client.call_method("tools/call", {"name": "test_tool", "arguments": {"i": i}})
+            for i in range(6)
+        ))
+    finally:
+        await client.close()
+    
+    assert len(results) == 6
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_call_tool_initializes_once_without_health_check():
+    """Test that lazy initialization runs once when the health check is disabled."""
+    methods = []
+    compatibility_checks = 0
+    
+    def handler(request):
+        body = json.loads(request.content)
+        methods.append(body["method"])
+        return httpx.Response(200, json={
+            "jsonrpc": "2.0", "id": body["id"],
+            "result": {"content": [{"type": "text", "text": "{}"}]}
+        })
+    
+    async def check_compatibility_when_online():
+        nonlocal compatibility_checks
+        compatibility_checks += 1
+    
+    client = _make_mock_client(handler, UnrealMCPSettings(enable_health_check=False))
+    try:
+        for _ in range(2):
+            result = await call_tool(
+                "test_tool", {}, client, ServerSettings(), {"test_tool": {}},
+                check_compatibility_when_online
+            )
+            assert not result.get("isError")
+        await asyncio.sleep(0)
+    finally:
+        await client.close()
+    
+    assert methods == ["ping", "tools/call", "tools/call"]
+    assert compatibility_checks == 1
+    assert client._health_check_task is None
+
+
+@pytest.mark.asyncio
+async def test_call_tool_recovers_offline_backend_without_health_check():
+    """Test that a tool call re-probes an offline backend when no health check runs."""
+    backend_up = False
+    
+    def handler(request):
+        if not backend_up:
+            raise httpx.ConnectError("connection refused", request=request)
+        body = json.loads(request.content)
+        return httpx.Response(200, json={
+            "jsonrpc": "2.0", "id": body["id"],
+            "result": {"content": [{"type": "text", "text": "{}"}]}
+        })
+    
+    client = _make_mock_client(handler, UnrealMCPSettings(enable_health_check=False))
+    try:
+        result = await call_tool("test_tool", {}, client, ServerSettings(), {"test_tool": {}})
+        assert result.get("isError") is True
+        assert client.state == ConnectionState.OFFLINE
+        
+        backend_up = True
+        result = await call_tool("test_tool", {}, client, ServerSettings(), {"test_tool": {}})
+        assert not result.get("isError")
+        assert client.state == ConnectionState.ONLINE
+    finally:
+        await client.close()
+
+
 # ============================================================================
 # Test Runner
 # ============================================================================